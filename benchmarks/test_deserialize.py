@@ -0,0 +1,146 @@
+"""Benchmarks for the deserialization of Halogen schemas.
+
+Run with ``tox -e benchmark``, see the Benchmarks section of the README for comparing the runs.
+"""
+
+import pytest
+
+import halogen
+from halogen import exceptions
+
+
+class AuthorSchema(halogen.Schema):
+    self = halogen.Link(attr=lambda value: "/authors/1")
+    name = halogen.Attr(halogen.types.String())
+    year_of_birth = halogen.Attr(halogen.types.Int(), attr="born.year")
+
+
+class BookSchema(halogen.Schema):
+    self = halogen.Link(attr=lambda value: "/books/1")
+    title = halogen.Attr(halogen.types.String())
+    year = halogen.Attr(halogen.types.Int())
+    available = halogen.Attr(halogen.types.Boolean(), required=False, default=False)
+    author = halogen.Attr(AuthorSchema)
+
+
+class ShelfSchema(halogen.Schema):
+    self = halogen.Link(attr=lambda value: "/shelves/1")
+    name = halogen.Attr(halogen.types.String())
+    books = halogen.Attr(halogen.types.List(BookSchema))
+
+
+@pytest.fixture
+def nested_payload():
+    """Shelf with a hundred books."""
+    return {
+        "name": "Fiction",
+        "books": [
+            {
+                "title": "The Witches",
+                "year": "1983",
+                "author": {"name": "Roald Dahl", "born": {"year": 1916}},
+            }
+        ]
+        * 100,
+    }
+
+
+def deserialize_per_attribute(schema, value, **kwargs):
+    """Deserialize the way schemas did before they were compiled, one `Attr.deserialize` call at a time."""
+    errors = []
+    result = {}
+    for attr in schema.__attrs__.values():
+        try:
+            result[attr.name] = attr.deserialize(value, **kwargs)
+        except NotImplementedError:
+            continue
+        except ValueError as e:
+            errors.append(exceptions.ValidationError(e, attr.name))
+        except exceptions.ValidationError as e:
+            e.attr = attr.name
+            errors.append(e)
+        except (KeyError, AttributeError):
+            if attr.required:
+                errors.append(exceptions.ValidationError("Missing attribute.", attr.name))
+    if errors:
+        raise exceptions.ValidationError(errors)
+    return result
+
+
+class PerAttributeBookSchema(BookSchema):
+    @classmethod
+    def deserialize(cls, value, output=None, **kwargs):
+        return deserialize_per_attribute(cls, value, **kwargs)
+
+
+class PerAttributeShelfSchema(ShelfSchema):
+    books = halogen.Attr(halogen.types.List(PerAttributeBookSchema))
+
+    @classmethod
+    def deserialize(cls, value, output=None, **kwargs):
+        return deserialize_per_attribute(cls, value, **kwargs)
+
+
+def test_deserialize_nested(benchmark, nested_payload):
+    """Deserialize a nested payload with the compiled plan."""
+    result = benchmark(ShelfSchema.deserialize, nested_payload)
+    assert result == PerAttributeShelfSchema.deserialize(nested_payload)
+
+
+def test_deserialize_nested_per_attribute(benchmark, nested_payload):
+    """Deserialize a nested payload attribute by attribute, as the baseline for the compiled plan."""
+    benchmark(PerAttributeShelfSchema.deserialize, nested_payload)
+
+
+class TicketSchema(halogen.Schema):
+    row = halogen.Attr(halogen.types.Int(validators=[halogen.validators.Range(min=1, max=40)]))
+    seat = halogen.Attr(halogen.types.Int(validators=[halogen.validators.Range(min=1, max=25)]))
+    holder = halogen.Attr(halogen.types.String(validators=[halogen.validators.Length(min_length=2, max_length=20)]))
+    category = halogen.Attr(halogen.types.String(validators=[halogen.validators.OneOf(["A", "B", "C"])]))
+    scanned = halogen.Attr(halogen.types.Boolean())
+    barcode = halogen.Attr(halogen.types.String())
+
+
+class OrderSchema(halogen.Schema):
+    tickets = halogen.Attr(
+        halogen.types.List(TicketSchema, validators=[halogen.validators.Length(min_length=1, max_length=500)])
+    )
+
+
+@pytest.fixture
+def invalid_payload():
+    """Order with a hundred tickets that each fail on every attribute."""
+    return {
+        "tickets": [
+            {"row": 0, "seat": "26", "holder": "X", "category": "D", "scanned": "maybe"},
+        ]
+        * 100,
+    }
+
+
+def deserialize_invalid(schema, value, **kwargs):
+    """Deserialize a value that is expected to fail the validation."""
+    try:
+        schema.deserialize(value, **kwargs)
+    except exceptions.ValidationError as e:
+        return e
+    raise AssertionError("The value is valid.")
+
+
+def test_deserialize_validation_errors(benchmark, invalid_payload):
+    """Deserialize a payload with many validation errors."""
+    error = benchmark(deserialize_invalid, OrderSchema, invalid_payload)
+    assert len(error.errors) == 1
+
+
+def test_deserialize_validated_list(benchmark):
+    """Deserialize a large list of integers validated against bounds that are evaluated lazily."""
+    type_ = halogen.types.List(
+        halogen.types.Int(validators=[halogen.validators.Range(min=lambda: 0, max=lambda: 100000)])
+    )
+    benchmark(type_.deserialize, list(range(10000)))
+
+
+def test_deserialize_validation_errors_fail_fast(benchmark, invalid_payload):
+    """Deserialize a payload with many validation errors, stopping at the first one."""
+    benchmark(lambda value: deserialize_invalid(OrderSchema, value, fail_fast=True), invalid_payload)
@@ -0,0 +1,34 @@
+"""Benchmarks for the import of Halogen.
+
+Run with ``tox -e benchmark``, see the Benchmarks section of the README for comparing the runs.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def import_time(module):
+    """Import the module in a fresh interpreter.
+
+    :return: Cumulative import time of the module in microseconds, as reported by ``python -X importtime``.
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import {0}".format(module)],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    ).stderr
+    for line in reversed(output.splitlines()):
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="-X importtime requires Python 3.7")
+def test_import(benchmark):
+    """Import halogen in a fresh interpreter, recording the import time reported by the interpreter."""
+    import_times = []
+    benchmark.pedantic(lambda: import_times.append(import_time("halogen")), rounds=10)
+    benchmark.extra_info["import_time"] = min(import_times)
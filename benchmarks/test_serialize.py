@@ -0,0 +1,188 @@
+"""Benchmarks for the serialization of Halogen schemas.
+
+Run with ``tox -e benchmark``, see the Benchmarks section of the README for comparing the runs.
+"""
+
+import tracemalloc
+from collections import OrderedDict
+
+import pytest
+
+import halogen
+import halogen.cache
+
+
+def tree_schemas(dict_class):
+    """Create the schemas of a deep embedded tree: a venue with halls, with rows, with seats."""
+
+    class Base(halogen.Schema):
+        pass
+
+    Base.dict_class = dict_class
+
+    class SeatSchema(Base):
+        self = halogen.Link(attr=lambda seat: "/seats/{0}".format(seat["id"]))
+        number = halogen.Attr(halogen.types.Int())
+        available = halogen.Attr(halogen.types.Boolean())
+
+    class RowSchema(Base):
+        self = halogen.Link(attr=lambda row: "/rows/{0}".format(row["id"]))
+        name = halogen.Attr()
+        seats = halogen.Embedded(halogen.types.List(SeatSchema))
+
+    class HallSchema(Base):
+        self = halogen.Link(attr=lambda hall: "/halls/{0}".format(hall["id"]))
+        name = halogen.Attr()
+        rows = halogen.Embedded(halogen.types.List(RowSchema))
+
+    class VenueSchema(Base):
+        self = halogen.Link("/venues/1")
+        name = halogen.Attr()
+        halls = halogen.Embedded(halogen.types.List(HallSchema))
+
+    return VenueSchema
+
+
+@pytest.fixture
+def venue():
+    """Venue with 3 halls of 20 rows of 25 seats."""
+    return {
+        "name": "Concertgebouw",
+        "halls": [
+            {
+                "id": hall,
+                "name": "Hall {0}".format(hall),
+                "rows": [
+                    {
+                        "id": row,
+                        "name": "Row {0}".format(row),
+                        "seats": [{"id": seat, "number": seat, "available": True} for seat in range(25)],
+                    }
+                    for row in range(20)
+                ],
+            }
+            for hall in range(3)
+        ],
+    }
+
+
+ACME = halogen.Curie(name="acme", href="/relations/{rel}", templated=True)
+
+
+class FlatSchema(halogen.Schema):
+    self = halogen.Link(attr=lambda value: "/events/{0}".format(value["id"]))
+    id = halogen.Attr(halogen.types.Int())
+    title = halogen.Attr(halogen.types.String())
+    subtitle = halogen.Attr(halogen.types.String(), required=False)
+    venue = halogen.Attr(attr="location.venue")
+    city = halogen.Attr(attr="location.city")
+    capacity = halogen.Attr(halogen.types.Int())
+    sold_out = halogen.Attr(halogen.types.Boolean())
+    visible = halogen.Attr(halogen.types.Boolean(), default=True)
+    kind = halogen.Attr("event")
+
+
+class LinkListSchema(halogen.Schema):
+    self = halogen.Link(attr=lambda value: "/events/{0}".format(value["id"]))
+    organizer = halogen.Link(attr=lambda value: "/organizers/{0}".format(value["organizer"]), curie=ACME)
+    performers = halogen.schema.LinkList(attr="performers", curie=ACME)
+    tags = halogen.schema.LinkList(attr="tags", curie=ACME)
+
+
+@pytest.fixture
+def events():
+    """A hundred events."""
+    return [
+        {
+            "id": event,
+            "title": "Event {0}".format(event),
+            "location": {"venue": "Concertgebouw", "city": "Amsterdam"},
+            "capacity": 2000,
+            "sold_out": False,
+            "organizer": event % 7,
+            "performers": ["/performers/{0}".format(performer) for performer in range(10)],
+            "tags": ["/tags/{0}".format(tag) for tag in range(5)],
+        }
+        for event in range(100)
+    ]
+
+
+def test_serialize_flat(benchmark, events):
+    """Serialize a flat schema."""
+    benchmark(FlatSchema.serialize, events[0])
+
+
+def test_serialize_flat_list(benchmark, events):
+    """Serialize a list of flat schemas."""
+    benchmark(halogen.types.List(FlatSchema).serialize, events)
+
+
+def test_serialize_link_list(benchmark, events):
+    """Serialize link lists with curies."""
+    benchmark(halogen.types.List(LinkListSchema).serialize, events)
+
+
+@pytest.mark.parametrize("dict_class", [dict, OrderedDict], ids=["dict", "OrderedDict"])
+def test_serialize_deep_tree(benchmark, venue, dict_class):
+    """Serialize a deep embedded tree, recording the peak memory of the serialized value."""
+    schema = tree_schemas(dict_class)
+
+    tracemalloc.start()
+    schema.serialize(venue)
+    benchmark.extra_info["peak_memory"] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    benchmark(schema.serialize, venue)
+
+
+def order_schemas(memoize):
+    """Create the schemas of an order listing that embeds the same venues under many orders."""
+
+    class VenueSchema(halogen.Schema):
+        self = halogen.Link(attr=lambda venue: "/venues/{0}".format(venue["id"]))
+        name = halogen.Attr()
+        city = halogen.Attr()
+        capacity = halogen.Attr(halogen.types.Int())
+
+    class OrderSchema(halogen.Schema):
+        self = halogen.Link(attr=lambda order: "/orders/{0}".format(order["id"]))
+        total = halogen.Attr(halogen.types.Int())
+        venue = halogen.Embedded(VenueSchema, memoize=memoize)
+
+    class OrdersSchema(halogen.Schema):
+        self = halogen.Link("/orders")
+        orders = halogen.Embedded(halogen.types.List(OrderSchema))
+
+    return OrdersSchema
+
+
+@pytest.fixture
+def orders():
+    """Five hundred orders at five venues."""
+    venues = [
+        {"id": venue, "name": "Venue {0}".format(venue), "city": "Amsterdam", "capacity": 2000} for venue in range(5)
+    ]
+    return {"orders": [{"id": order, "total": order, "venue": venues[order % 5]} for order in range(500)]}
+
+
+@pytest.mark.parametrize("memoize", [False, True], ids=["plain", "memoized"])
+def test_serialize_fan_out(benchmark, orders, memoize):
+    """Serialize the same embedded resources under many resources."""
+    benchmark(order_schemas(memoize).serialize, orders)
+
+
+class CachedFlatSchema(FlatSchema):
+    cache = halogen.cache.MemoryCache(max_size=1000)
+    cache_key = "id"
+
+
+@pytest.mark.parametrize("schema", [FlatSchema, CachedFlatSchema], ids=["plain", "cached"])
+def test_serialize_cached_list(benchmark, events, schema):
+    """Serialize a list of unchanged objects."""
+    benchmark(halogen.types.List(schema).serialize, events)
+
+
+def test_serialize_fields(benchmark, venue):
+    """Serialize a few fields of a deep embedded tree."""
+    schema = tree_schemas(dict)
+    benchmark(schema.serialize, venue, fields=["name", "_links.self", "_embedded.halls.name"])
@@ -0,0 +1,148 @@
+"""Benchmarks for the built-in Halogen types.
+
+Run with ``tox -e benchmark``, see the Benchmarks section of the README for comparing the runs.
+"""
+
+import datetime
+import decimal
+import enum
+
+import pytest
+
+import halogen
+
+
+class Amount(object):
+    """Money amount, the value of the `Amount` type."""
+
+    def __init__(self, currency, amount):
+        self.currency = currency
+        self.amount = amount
+
+    def as_quantized(self, digits=0):
+        return Amount(self.currency, self.amount.quantize(decimal.Decimal(10) ** -digits))
+
+    def as_tuple(self):
+        return self.currency, self.amount
+
+
+class Color(enum.Enum):
+    RED = "red"
+    GREEN = "green"
+    BLUE = "blue"
+
+
+CURRENCIES = ["EUR", "GBP", "USD"]
+
+SERIALIZE = [
+    ("ISODateTime", halogen.types.ISODateTime(), datetime.datetime(2024, 5, 17, 20, 30, 15)),
+    (
+        "ISOUTCDateTime",
+        halogen.types.ISOUTCDateTime(),
+        datetime.datetime(2024, 5, 17, 20, 30, 15, 250000, tzinfo=datetime.timezone(datetime.timedelta(hours=2))),
+    ),
+    ("ISOUTCDate", halogen.types.ISOUTCDate(), datetime.date(2024, 5, 17)),
+    (
+        "Amount",
+        halogen.types.Amount(currencies=CURRENCIES, amount_class=Amount),
+        Amount("EUR", decimal.Decimal("35.5")),
+    ),
+    ("Enum", halogen.types.Enum(Color), Color.GREEN),
+    ("Enum-values", halogen.types.Enum(Color, use_values=True), Color.GREEN),
+    ("Boolean", halogen.types.Boolean(), True),
+    ("Int", halogen.types.Int(), 42),
+    ("String", halogen.types.String(), "Hello World"),
+]
+
+DESERIALIZE = [
+    ("ISODateTime", halogen.types.ISODateTime(), "2024-05-17T20:30:15+02:00"),
+    ("ISOUTCDateTime", halogen.types.ISOUTCDateTime(), "2024-05-17T18:30:15Z"),
+    ("ISOUTCDate", halogen.types.ISOUTCDate(), "2024-05-17"),
+    ("Amount-string", halogen.types.Amount(currencies=CURRENCIES, amount_class=Amount), "EUR35.50"),
+    (
+        "Amount-cached",
+        halogen.types.Amount(currencies=CURRENCIES, amount_class=Amount, cache_size=128),
+        "EUR35.50",
+    ),
+    (
+        "Amount-dict",
+        halogen.types.Amount(currencies=CURRENCIES, amount_class=Amount),
+        {"currency": "EUR", "amount": "35.50"},
+    ),
+    ("Enum", halogen.types.Enum(Color), "GREEN"),
+    ("Enum-values", halogen.types.Enum(Color, use_values=True), "green"),
+    ("Boolean", halogen.types.Boolean(), "true"),
+    ("Int", halogen.types.Int(), "42"),
+    ("String", halogen.types.String(), "Hello World"),
+]
+
+
+@pytest.mark.parametrize(["type_", "value"], [case[1:] for case in SERIALIZE], ids=[case[0] for case in SERIALIZE])
+def test_serialize(benchmark, type_, value):
+    """Serialize a single value with a built-in type."""
+    benchmark(type_.serialize, value)
+
+
+@pytest.mark.parametrize(["type_", "value"], [case[1:] for case in DESERIALIZE], ids=[case[0] for case in DESERIALIZE])
+def test_deserialize(benchmark, type_, value):
+    """Deserialize a single value with a built-in type."""
+    benchmark(type_.deserialize, value)
+
+
+@pytest.mark.parametrize(["type_", "value"], [case[1:] for case in SERIALIZE], ids=[case[0] for case in SERIALIZE])
+def test_serialize_list(benchmark, type_, value):
+    """Serialize a large list of values with a built-in type."""
+    list_type = halogen.types.List(type_)
+    benchmark(list_type.serialize, [value] * 10000)
+
+
+@pytest.mark.parametrize(["type_", "value"], [case[1:] for case in DESERIALIZE], ids=[case[0] for case in DESERIALIZE])
+def test_deserialize_list(benchmark, type_, value):
+    """Deserialize a large list of values with a built-in type."""
+    list_type = halogen.types.List(type_)
+    benchmark(list_type.deserialize, [value] * 10000)
+
+
+def format_as_utc_isoformat(value):
+    """Format UTC times the way `ISOUTCDateTime` did before it had a dedicated formatter."""
+    value = value.astimezone(datetime.timezone.utc)
+    value = value.replace(microsecond=0)
+    return value.isoformat().replace("+00:00", "Z")
+
+
+@pytest.fixture
+def datetimes():
+    """Ten thousand distinct aware datetimes."""
+    start = datetime.datetime(2024, 5, 17, 20, 30, 15, 250000, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))
+    return [start + datetime.timedelta(minutes=minute) for minute in range(10000)]
+
+
+def test_serialize_many_datetimes(benchmark, datetimes):
+    """Serialize a list of datetimes in UTC."""
+    serialized = benchmark(halogen.types.ISOUTCDateTime().serialize_many, datetimes)
+    assert serialized == [format_as_utc_isoformat(value) for value in datetimes]
+
+
+def test_serialize_many_datetimes_isoformat(benchmark, datetimes):
+    """Serialize a list of datetimes in UTC with `isoformat`, as the baseline for the dedicated formatter."""
+    benchmark(lambda values: [format_as_utc_isoformat(value) for value in values], datetimes)
+
+
+@pytest.fixture
+def line_items():
+    """Ten thousand line item amounts, with the prices repeated as they are in the invoices."""
+    prices = [decimal.Decimal(price) for price in ("9.95", "12.5", "25", "49.99", "7.25")]
+    return [Amount("EUR", prices[item % len(prices)]) for item in range(10000)]
+
+
+def test_serialize_many_amounts(benchmark, line_items):
+    """Serialize a list of line item amounts."""
+    type_ = halogen.types.Amount(currencies=CURRENCIES, amount_class=Amount)
+    serialized = benchmark(halogen.types.List(type_).serialize, line_items)
+    assert serialized == [type_.serialize(value) for value in line_items]
+
+
+def test_serialize_many_amounts_per_item(benchmark, line_items):
+    """Serialize a list of line item amounts one by one, as the baseline for the batch serialization."""
+    type_ = halogen.types.Amount(currencies=CURRENCIES, amount_class=Amount)
+    benchmark(lambda values: [type_.serialize(value) for value in values], line_items)
@@ -0,0 +1,247 @@
+"""Caches of the serialized values of the schemas.
+
+A schema with a cache serializes an object once per version and context, and returns the cached value (or the cached
+JSON text of `Schema.dumps`) while the object doesn't change::
+
+    class EventSchema(halogen.Schema):
+        cache = halogen.cache.MemoryCache(max_size=10000, ttl=300)
+        cache_key = "id"
+        cache_version = "modified"
+        cache_context = ("language",)
+
+        self = halogen.Link(attr=lambda event: "/events/{0}".format(event.id))
+        title = halogen.Attr()
+
+Every call gets its own copy of the cached value, unless the `MemoryCache` is created with `copy_values=False`.
+Schemas that embed a cached schema keep their own cache entries, their version has to change when the embedded objects
+change.
+"""
+
+import collections
+import hashlib
+import os
+import pickle
+import re
+import shutil
+import tempfile
+import threading
+import time
+
+from halogen import schema as _schema
+
+
+class Cache(object):
+    """Cache backend of the serialized values.
+
+    The values are stored by a group and a key. The group is made of the schema and the key of the object, the key is
+    made of the operation, the version of the object and the context. All the values of a group are invalidated
+    together.
+    """
+
+    def get(self, group, key):
+        """Return the cached value.
+
+        :raises: KeyError if the value isn't cached or is expired.
+        """
+        raise NotImplementedError()
+
+    def set(self, group, key, value):
+        """Cache the value."""
+        raise NotImplementedError()
+
+    def invalidate(self, group):
+        """Remove the cached values of the group."""
+        raise NotImplementedError()
+
+    def clear(self):
+        """Remove all the cached values."""
+        raise NotImplementedError()
+
+
+def _copy(value):
+    """Copy the dicts and the lists of a serialized value, the other values are immutable or left as they are."""
+    if isinstance(value, dict):
+        value = value.copy()
+        for key, item in value.items():
+            if isinstance(item, (dict, list)):
+                value[key] = _copy(item)
+        return value
+    if isinstance(value, list):
+        return [_copy(item) if isinstance(item, (dict, list)) else item for item in value]
+    return value
+
+
+class MemoryCache(Cache):
+    """In-memory cache that evicts the least recently used values."""
+
+    def __init__(self, max_size=1024, ttl=None, timer=time.monotonic, copy_values=True):
+        """Create a memory cache.
+
+        :param max_size: Maximal number of the cached values.
+        :param ttl: Time in seconds after which the cached values expire, they never expire by default.
+        :param timer: Function that returns the current time in seconds.
+        :param copy_values: Store and return copies of the dicts and the lists of the serialized values, so that the
+            callers can modify them. Without the copies the cached values are shared by the callers and by the values
+            of the schemas that embed them, modifying them in place changes the cache.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.timer = timer
+        self.copy_values = copy_values
+        self._values = collections.OrderedDict()
+        self._groups = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._values)
+
+    def get(self, group, key):
+        with self._lock:
+            expires, value = self._values[group, key]
+            if expires is not None and expires <= self.timer():
+                self._remove(group, key)
+                raise KeyError(key)
+            self._values.move_to_end((group, key))
+        return _copy(value) if self.copy_values else value
+
+    def set(self, group, key, value):
+        expires = None if self.ttl is None else self.timer() + self.ttl
+        if self.copy_values:
+            value = _copy(value)
+        with self._lock:
+            self._values[group, key] = (expires, value)
+            self._values.move_to_end((group, key))
+            self._groups.setdefault(group, set()).add(key)
+            while len(self._values) > self.max_size:
+                (evicted_group, evicted_key), _ = self._values.popitem(last=False)
+                self._discard_key(evicted_group, evicted_key)
+
+    def invalidate(self, group):
+        with self._lock:
+            for key in self._groups.pop(group, ()):
+                del self._values[group, key]
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            self._groups.clear()
+
+    def _remove(self, group, key):
+        del self._values[group, key]
+        self._discard_key(group, key)
+
+    def _discard_key(self, group, key):
+        keys = self._groups[group]
+        keys.discard(key)
+        if not keys:
+            del self._groups[group]
+
+
+class FileCache(Cache):
+    """Local file cache, shared by the processes of a host.
+
+    The values are pickled into a folder per group. A new version of a value replaces the files of its older versions
+    (with the same operation and context), the expired files of the group are removed when a value is cached. Only
+    point it at a directory that isn't writable by others.
+    """
+
+    _NAME = re.compile("^[0-9a-f]{40}$")
+
+    def __init__(self, directory, ttl=None):
+        """Create a file cache.
+
+        :param directory: Directory of the cached values, it is created on the first write.
+        :param ttl: Time in seconds after which the cached values expire, they never expire by default.
+        """
+        self.directory = directory
+        self.ttl = ttl
+
+    def get(self, group, key):
+        path = os.path.join(self._group_directory(group), self._file_name(key))
+        try:
+            if self.ttl is not None and os.path.getmtime(path) + self.ttl <= time.time():
+                os.remove(path)
+                raise KeyError(key)
+            with open(path, "rb") as fp:
+                return pickle.load(fp)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            # Missing, just removed or partially written by an older version
+            raise KeyError(key)
+
+    def set(self, group, key, value):
+        directory = self._group_directory(group)
+        os.makedirs(directory, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        name = self._file_name(key)
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                pickle.dump(value, fp, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, os.path.join(directory, name))
+        except BaseException:
+            os.remove(temporary)
+            raise
+        self._evict(directory, name)
+
+    def invalidate(self, group):
+        shutil.rmtree(self._group_directory(group), ignore_errors=True)
+
+    def clear(self):
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if self._NAME.match(name):
+                shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+
+    def _evict(self, directory, name):
+        """Remove the older versions of the cached value and the expired values of the group."""
+        slot = name.partition("-")[0]
+        expired = None if self.ttl is None else time.time() - self.ttl
+        try:
+            names = os.listdir(directory)
+        except FileNotFoundError:  # Invalidated meanwhile
+            return
+        for other in names:
+            if other == name or other.endswith(".tmp"):
+                continue
+            path = os.path.join(directory, other)
+            try:
+                if other.partition("-")[0] == slot or (expired is not None and os.path.getmtime(path) <= expired):
+                    os.remove(path)
+            except FileNotFoundError:  # Removed by another process
+                pass
+
+    def _group_directory(self, group):
+        return os.path.join(self.directory, self._name(group))
+
+    @classmethod
+    def _file_name(cls, key):
+        """Return the file name of the key, the name of its operation and context followed by the name of its version.
+
+        The keys that are not (operation, version, context) tuples don't have versions.
+        """
+        if isinstance(key, tuple) and len(key) == 3:
+            operation, version, context = key
+            return "{0}-{1}".format(cls._name((operation, context)), cls._name(version))
+        return "{0}-".format(cls._name(key))
+
+    @staticmethod
+    def _name(value):
+        return hashlib.sha1(repr(value).encode("utf-8")).hexdigest()
+
+
+def invalidate(schema, value=None, key=None):
+    """Remove the cached serializations of an object, for example when it is saved.
+
+    :param schema: Schema class with a cache.
+    :param value: Object to remove, its key is read with the `cache_key` of the schema.
+    :param key: Key of the object to remove, instead of the object.
+    """
+    if schema.cache is None:
+        raise ValueError("{0} doesn't have a cache".format(schema.__qualname__))
+    if key is None:
+        key = _schema._cache_getter(schema.cache_key)(value)
+    schema.cache.invalidate(_schema._cache_group(schema, key))
@@ -1,5 +1,7 @@
 """Halogen exceptions."""
 
+import contextlib
+import contextvars
 import json
 
 
@@ -38,8 +40,104 @@ class ValidationError(Exception):
             result["attr"] = self.attr if self.attr is not None else "<root>"
         return result
 
+    def _state(self):
+        """Return the state of the error tree that its representation depends on.
+
+        The errors themselves are a part of the state, so they are compared by equality and kept alive.
+        """
+        return (
+            self.attr,
+            self.index,
+            tuple(error._state() if isinstance(error, ValidationError) else error for error in self.errors),
+        )
+
+    def iter_errors(self, path=""):
+        """Iterate over the flattened errors.
+
+        :param path: Path of the parent error.
+        :return: Generator of (path, message) tuples, the path is a slash separated path to the attribute of the error.
+        """
+        if not path.endswith("/"):
+            path += "/"
+        if self.attr is not None:
+            path += self.attr
+        elif self.index is not None:
+            path += str(self.index)
+
+        for error in self.errors:
+            if isinstance(error, ValidationError):
+                yield from error.iter_errors(path)
+            elif isinstance(error, Exception):
+                yield path, str(error)
+            else:
+                yield path, error
+
     def __str__(self):
-        return json.dumps(self.to_dict())
+        # The JSON text is cached for the errors that are logged or raised again, until the error tree changes
+        state = self._state()
+        cached = self.__dict__.get("_json")
+        if cached is not None and cached[0] == state:
+            return cached[1]
+        text = json.dumps(self.to_dict())
+        self._json = (state, text)
+        return text
+
+
+class _ErrorBudget(object):
+    """Number of errors that the deserialization collects before it stops."""
+
+    __slots__ = ("max_errors", "count", "collected")
+
+    def __init__(self, max_errors):
+        if max_errors < 1:
+            raise ValueError("max_errors must be at least 1")
+        self.max_errors = max_errors
+        self.count = 0
+        self.collected = set()
+
+    def spend(self, error):
+        """Count the error, the errors that collect other errors are counted already.
+
+        :return: True if the budget is spent.
+        """
+        if error not in self.collected:
+            self.count += 1
+        return self.count >= self.max_errors
+
+
+_error_budget = contextvars.ContextVar("halogen_error_budget", default=None)
+
+
+@contextlib.contextmanager
+def _limit_errors(fail_fast=False, max_errors=None):
+    """Limit the number of errors that the deserialization collects.
+
+    :param fail_fast: Stop at the first error.
+    :param max_errors: Stop at this number of errors.
+    """
+    token = _error_budget.set(_ErrorBudget(1 if fail_fast else max_errors))
+    try:
+        yield
+    finally:
+        _error_budget.reset(token)
+
+
+def _spend(error):
+    """Count the collected error against the error budget of the deserialization.
+
+    :return: True if the deserialization has to stop collecting errors.
+    """
+    budget = _error_budget.get()
+    return budget is not None and budget.spend(error)
+
+
+def _collect(errors):
+    """Create the error that collects the errors of the deserialization."""
+    error = ValidationError(errors)
+    budget = _error_budget.get()
+    if budget is not None:
+        budget.collected.add(error)
+    return error
 
 
 class ExcludedValueException(Exception):
@@ -0,0 +1,354 @@
+"""Profiling of the serialization and the deserialization of the schemas.
+
+The profiler compiles the schemas again with every compiled schema and attribute function wrapped into a recorder, so
+the schemas don't have any profiling overhead while it's disabled::
+
+    with halogen.profile.Profiler() as profiler:
+        BookSchema.serialize(book)
+
+    print(profiler.report())
+
+The command line profiler runs a schema on a fixture and prints its throughput, latencies, allocations and the hottest
+schemas and attributes::
+
+    python -m halogen.profile app.schemas.BookSchema fixtures/book.json --mode serialize --runs 1000
+"""
+
+import argparse
+import importlib
+import json
+import os
+import pickle
+import sys
+import time
+import tracemalloc
+
+from halogen import exceptions
+from halogen import schema as _schema
+
+OPERATIONS = ("serialize", "dumps", "deserialize")
+"""Operations of the schemas that the profiler records."""
+
+SORT_KEYS = ("self_time", "total_time", "calls", "exceptions")
+"""Statistics that the report can be sorted by."""
+
+
+class Stats(object):
+    """Statistics of the calls of a schema or of an attribute."""
+
+    __slots__ = ("calls", "total_time", "self_time", "exceptions")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_time = 0.0
+        self.self_time = 0.0
+        self.exceptions = 0
+
+    def __iadd__(self, other):
+        self.calls += other.calls
+        self.total_time += other.total_time
+        self.self_time += other.self_time
+        self.exceptions += other.exceptions
+        return self
+
+    def to_dict(self):
+        """Return a dictionary representation of the statistics.
+
+        :return: A dict with the keys:
+            - calls: Number of the calls.
+            - total_time: Time of the calls in seconds, including the nested schemas and attributes.
+            - self_time: Time of the calls in seconds, excluding the nested schemas and attributes.
+            - exceptions: Number of the calls that raised an exception, including the missing optional attributes.
+        """
+        return {
+            "calls": self.calls,
+            "total_time": self.total_time,
+            "self_time": self.self_time,
+            "exceptions": self.exceptions,
+        }
+
+
+def schema_label(schema):
+    """Return the dotted path of the schema class."""
+    return "{0}.{1}".format(schema.__module__, schema.__qualname__)
+
+
+def attr_label(attr):
+    """Return the path of the attribute in the HAL structure, prefixed with its compartment."""
+    if attr.compartment is None:
+        return attr.key
+    return "{0}.{1}".format(attr.compartment, attr.key)
+
+
+class Profiler(object):
+    """Profiler of the schemas.
+
+    Records the calls of the schemas and of their attributes (including the links and the embedded resources). Only
+    one profiler can be enabled at once, it records the calls of a single thread at a time.
+    """
+
+    def __init__(self, timer=time.perf_counter):
+        """Create a profiler.
+
+        :param timer: Function that returns the current time in seconds.
+        """
+        self.timer = timer
+        self._stats = {}
+        self._stack = [0.0]
+
+    @property
+    def enabled(self):
+        """Is the profiler recording the calls."""
+        return _schema._profiler is self
+
+    def enable(self):
+        """Start recording, the schemas are compiled again with the profiling."""
+        if _schema._profiler is not None and _schema._profiler is not self:
+            raise RuntimeError("Another profiler is enabled.")
+        _schema._profiler = self
+        _schema._recompile()
+
+    def disable(self):
+        """Stop recording, the schemas are compiled again without the profiling."""
+        if _schema._profiler is self:
+            _schema._profiler = None
+            _schema._recompile()
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
+
+    def reset(self):
+        """Clear the recorded statistics."""
+        for stats in self._stats.values():
+            stats.__init__()
+
+    def wrap(self, function, operation, schema, attr=None):
+        """Wrap a compiled function into the recorder of its statistics.
+
+        The time of the lazily serialized items (see `Schema.iterencode`) is recorded when they are consumed, outside
+        of the attribute that creates them.
+
+        :param function: Compiled function of the schema or of its attribute.
+        :param operation: Name of the operation, one of `OPERATIONS`.
+        :param schema: Schema class.
+        :param attr: Attribute of the schema, or None for the function of the schema itself.
+        :return: Function that records the calls.
+        """
+        stats = self._stats.get((operation, schema, attr))
+        if stats is None:
+            stats = self._stats[operation, schema, attr] = Stats()
+        timer = self.timer
+        stack = self._stack
+
+        def profiled(*args):
+            stack.append(0.0)
+            start = timer()
+            try:
+                return function(*args)
+            except BaseException:
+                stats.exceptions += 1
+                raise
+            finally:
+                elapsed = timer() - start
+                stats.calls += 1
+                stats.total_time += elapsed
+                stats.self_time += elapsed - stack.pop()
+                stack[-1] += elapsed
+
+        return profiled
+
+    def to_dict(self):
+        """Return a dictionary representation of the recorded statistics.
+
+        Only the schemas and the attributes that were called are included. The schemas with the same dotted path (for
+        example the schemas created with `Schema(**attrs)`) are merged.
+
+        :return: A dict of operations to the dicts of the schema dotted paths to the statistics of the schemas (see
+            `Stats.to_dict`), with an additional "attrs" key of the attribute paths to the statistics of the attributes.
+        """
+        result = {}
+        for (operation, schema, attr), stats in self._merged().items():
+            schemas = result.setdefault(operation, {})
+            if attr is None:
+                schemas.setdefault(schema, {"attrs": {}}).update(stats.to_dict())
+            else:
+                schemas.setdefault(schema, {"attrs": {}})["attrs"][attr] = stats.to_dict()
+        return result
+
+    def report(self, sort="self_time", limit=None):
+        """Return the text report of the recorded statistics.
+
+        :param sort: Statistic to sort the rows by in descending order, one of `SORT_KEYS`.
+        :param limit: Maximal number of the rows.
+        :return: Text table of the statistics, the times are in milliseconds. The rows of the schemas themselves have
+            "<root>" as the attribute.
+        """
+        if sort not in SORT_KEYS:
+            raise ValueError("sort must be one of {0}".format(", ".join(SORT_KEYS)))
+        rows = list(self._merged().items())
+        rows.sort(key=lambda row: getattr(row[1], sort), reverse=True)
+        if limit is not None:
+            rows = rows[:limit]
+
+        table = [("operation", "schema", "attribute", "calls", "total ms", "self ms", "exceptions")]
+        for (operation, schema, attr), stats in rows:
+            table.append(
+                (
+                    operation,
+                    schema,
+                    "<root>" if attr is None else attr,
+                    str(stats.calls),
+                    "{0:.3f}".format(stats.total_time * 1000),
+                    "{0:.3f}".format(stats.self_time * 1000),
+                    str(stats.exceptions),
+                )
+            )
+        widths = [max(len(row[column]) for row in table) for column in range(len(table[0]))]
+        return "\n".join(
+            "  ".join(
+                value.ljust(width) if column < 3 else value.rjust(width)
+                for column, (value, width) in enumerate(zip(row, widths))
+            ).rstrip()
+            for row in table
+        )
+
+    def _merged(self):
+        """Return the statistics of the called schemas and attributes keyed by their labels."""
+        merged = {}
+        for (operation, schema, attr), stats in self._stats.items():
+            if not stats.calls:
+                continue
+            key = (operation, schema_label(schema), None if attr is None else attr_label(attr))
+            if key not in merged:
+                merged[key] = Stats()
+            merged[key] += stats
+        return merged
+
+
+def _import(path):
+    """Import an object by its dotted path, "package.module.name" or "package.module:name"."""
+    if ":" in path:
+        module_name, _, name = path.partition(":")
+    else:
+        module_name, _, name = path.rpartition(".")
+    if not module_name:
+        raise ImportError("{0} is not a dotted path".format(path))
+    value = importlib.import_module(module_name)
+    for part in name.split("."):
+        value = getattr(value, part)
+    return value
+
+
+def _load_fixture(fixture):
+    """Load the fixture from a JSON or a pickle file, or call the factory with the dotted path.
+
+    :param fixture: Path of a ".json" file, a pickle file, or the dotted path of a value or of its factory.
+    :return: Value to serialize or to deserialize.
+    """
+    if os.path.isfile(fixture):
+        if fixture.endswith(".json"):
+            with open(fixture) as fp:
+                return json.load(fp)
+        with open(fixture, "rb") as fp:
+            return pickle.load(fp)
+    value = _import(fixture)
+    return value() if callable(value) else value
+
+
+def _percentile(values, percent):
+    """Return the percentile of the sorted values with the nearest-rank method."""
+    index = max(int(round(percent / 100.0 * len(values) + 0.5)) - 1, 0)
+    return values[min(index, len(values) - 1)]
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m halogen.profile", description="Profile the serialization or the deserialization of a schema."
+    )
+    parser.add_argument("schema", help="Dotted path of the schema class.")
+    parser.add_argument(
+        "fixture",
+        help="Path of a .json or a pickle file (only load trusted pickles), or the dotted path of a value or of the "
+        "factory that returns it.",
+    )
+    parser.add_argument("--mode", choices=OPERATIONS, default="serialize", help="Operation to profile.")
+    parser.add_argument("--runs", "-n", type=int, default=1000, help="Number of the runs.")
+    parser.add_argument("--top", type=int, default=10, help="Number of the hottest schemas and attributes.")
+    parser.add_argument("--sort", choices=SORT_KEYS, default="self_time", help="Statistic of the hottest attributes.")
+    return parser
+
+
+def main(argv=None):
+    """Profile a schema from the command line.
+
+    :param argv: Command line arguments, the arguments of the process by default.
+    :return: Exit status.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+    schema = _import(args.schema)
+    if not isinstance(schema, _schema._SchemaType):
+        parser.error("{0} is not a schema".format(args.schema))
+    value = _load_fixture(args.fixture)
+    operation = getattr(schema, args.mode)
+
+    def run():
+        try:
+            operation(value)
+        except exceptions.ValidationError:
+            return False
+        return True
+
+    # The first run compiles the lazily compiled functions
+    run()
+
+    timer = time.perf_counter
+    latencies = []
+    failures = 0
+    for _ in range(args.runs):
+        start = timer()
+        failures += not run()
+        latencies.append(timer() - start)
+    latencies.sort()
+    total = sum(latencies)
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        run()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    with Profiler() as profiler:
+        for _ in range(args.runs):
+            run()
+
+    out = sys.stdout
+    out.write("{0} {1}, {2} runs".format(schema_label(schema), args.mode, args.runs))
+    out.write(", {0} validation errors\n".format(failures) if failures else "\n")
+    out.write("throughput: {0:.1f} ops/s\n".format(args.runs / total if total else float("inf")))
+    percentiles = [latencies[0]] + [_percentile(latencies, percent) for percent in (50, 90, 99)] + [latencies[-1]]
+    out.write(
+        "latency ms: min {0:.3f}, p50 {1:.3f}, p90 {2:.3f}, p99 {3:.3f}, max {4:.3f}\n".format(
+            *(latency * 1000 for latency in percentiles)
+        )
+    )
+    out.write(
+        "allocations per run: {0:.1f} KiB peak, {1:.1f} KiB retained\n".format(
+            (peak - baseline) / 1024.0, (current - baseline) / 1024.0
+        )
+    )
+    out.write("\nhottest schemas and attributes (profiled):\n")
+    out.write(profiler.report(sort=args.sort, limit=args.top) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
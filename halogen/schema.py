@@ -1,8 +1,10 @@
 """Halogen schema primitives."""
 
+import copy
 import inspect
-from collections import OrderedDict, namedtuple
-from typing import Iterable, Optional, Union
+import json
+from collections import namedtuple
+from typing import Callable, Iterable, Optional, Union
 
 from cached_property import cached_property
 
@@ -37,6 +39,138 @@ def _get_context(argspec, kwargs):
     return dict((arg, kwargs[arg]) for arg in argspec.args if arg in kwargs)
 
 
+class _Context(dict):
+    """Context of a single top-level serialization or deserialization call.
+
+    Memoizes the context filtered for the arguments of the getters and the types, so that it is built only once per
+    call instead of once per attribute of every object. Holds the memo of the embedded resources that are serialized
+    once per call, see `Embedded`.
+    """
+
+    __slots__ = ("_filtered", "_memo")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._filtered = {}
+        self._memo = None
+
+    def filter(self, args):
+        """Return the part of the context that a function accepts.
+
+        :param args: Frozenset of the argument names of the function.
+        :return: Keywords arguments that function can accept.
+        """
+        if not self:
+            return self
+        try:
+            return self._filtered[args]
+        except KeyError:
+            filtered = self._filtered[args] = {arg: self[arg] for arg in args if arg in self}
+            return filtered
+
+    def memo(self):
+        """Return the memo of the serialized embedded resources of the call."""
+        memo = self._memo
+        if memo is None:
+            memo = {}
+            if self is not _EMPTY_CONTEXT:
+                self._memo = memo
+        return memo
+
+
+_EMPTY_CONTEXT = _Context()
+"""Shared context of the calls without context, the empty context is never modified."""
+
+
+def _make_context(kwargs, memoize=False):
+    """Create the context of a top-level call.
+
+    :param kwargs: Context of the call.
+    :param memoize: The call memoizes the embedded resources, so it needs its own context for the memo.
+    """
+    return _Context(kwargs) if kwargs or memoize else _EMPTY_CONTEXT
+
+
+def _compile_call(function):
+    """Compile a call of the function with the part of the context it accepts.
+
+    :param function: Function that accepts the value as the first positional argument.
+    :return: Function of (value, context) that calls the original function.
+    """
+    argspec = getargspec(function)
+    if argspec.has_kwargs:
+
+        def call(value, context):
+            return function(value, **context)
+
+    elif len(argspec.args) <= (2 if inspect.ismethod(function) else 1):
+        # The function doesn't take any context, skip the context plumbing
+        def call(value, context):
+            return function(value)
+
+    else:
+        args = frozenset(argspec.args)
+
+        def call(value, context):
+            return function(value, **context.filter(args))
+
+    return call
+
+
+def _compile_path_getter(path):
+    """Compile a dot-separated path into a getter.
+
+    :param path: Dot-separated path of attributes or dict keys.
+    :return: Function of (obj, context) that returns the value at the path of the object, the context is ignored.
+    """
+    attrs = tuple(path.split("."))
+
+    if len(attrs) == 1:
+        (attr,) = attrs
+
+        def get(obj, context=None):
+            if obj is None:
+                return None
+            obj = obj[attr] if isinstance(obj, dict) else getattr(obj, attr)
+            return obj() if callable(obj) else obj
+
+        return get
+
+    def get(obj, context=None):
+        for attr in attrs:
+            if obj is None:
+                # If obj is None (could be Nullable), just return None
+                return None
+            obj = obj[attr] if isinstance(obj, dict) else getattr(obj, attr)
+        return obj() if callable(obj) else obj
+
+    return get
+
+
+def _compile_path_setter(path):
+    """Compile a dot-separated path into a setter.
+
+    :param path: Dot-separated path of attributes or dict keys.
+    :return: Function that assigns the value at the path of the object, creating intermediate dicts.
+    """
+    attrs = path.split(".")
+    parents, last = tuple(attrs[:-1]), attrs[-1]
+
+    def set(obj, value):
+        for attr in parents:
+            parent, obj = obj, {}
+            if isinstance(parent, dict):
+                parent[attr] = obj
+            else:
+                setattr(parent, attr, obj)
+        if isinstance(obj, dict):
+            obj[last] = value
+        else:
+            setattr(obj, last, value)
+
+    return set
+
+
 class Accessor(object):
     """Object that encapsulates the getter and the setter of the attribute."""
 
@@ -45,6 +179,32 @@ class Accessor(object):
         self.getter = getter
         self.setter = setter
 
+    @property
+    def getter(self):
+        """Getter function or dot-separated path.
+
+        Reassigning the getter of an accessor that is compiled into the schemas compiles the schemas again.
+        """
+        return self._getter
+
+    @getter.setter
+    def getter(self, getter):
+        self._getter = getter
+        self._get_path = _compile_path_getter(getter) if isinstance(getter, str) else None
+        self.__dict__.pop("_getter_argspec", None)
+        if self.__dict__.get("_compiled"):
+            _recompile()
+
+    @property
+    def setter(self):
+        """Setter function or dot-separated path."""
+        return self._setter
+
+    @setter.setter
+    def setter(self, setter):
+        self._setter = setter
+        self._set_path = _compile_path_setter(setter) if isinstance(setter, str) else None
+
     @cached_property  # Purposefully caching the function signature
     def _getter_argspec(self):
         return getargspec(self.getter)
@@ -60,24 +220,22 @@ class Accessor(object):
             return self.getter(obj, **_get_context(self._getter_argspec, kwargs))
 
         assert isinstance(self.getter, str), "Accessor must be a function or a dot-separated string."
+        return self._get_path(obj)
 
-        if obj is None:
-            return None
-
-        for attr in self.getter.split("."):
-            if obj is None:
-                # If obj is None (could be Nullable), just return None
-                return None
+    def _compile_getter(self):
+        """Compile the getter into a function.
 
-            if isinstance(obj, dict):
-                obj = obj[attr]
-            else:
-                obj = getattr(obj, attr)
-
-        if callable(obj):
-            return obj()
-
-        return obj
+        :return: Function of (obj, context) that returns the value of object's attribute.
+        """
+        self._compiled = True
+        if type(self).get is not Accessor.get:
+            # The subclasses that override get are called with the context as the keyword arguments
+            return lambda obj, context: self.get(obj, **context)
+        if callable(self.getter):
+            return _compile_call(self.getter)
+        if isinstance(self.getter, str):
+            return self._get_path
+        return lambda obj, context: self.get(obj)
 
     def set(self, obj, value):
         """Set value for obj's attribute.
@@ -90,19 +248,7 @@ class Accessor(object):
             return self.setter(obj, value)
 
         assert isinstance(self.setter, str), "Accessor must be a function or a dot-separated string."
-
-        def _set(obj, attr, value):
-            if isinstance(obj, dict):
-                obj[attr] = value
-            else:
-                setattr(obj, attr, value)
-            return value
-
-        path = self.setter.split(".")
-        for attr in path[:-1]:
-            obj = _set(obj, attr, {})
-
-        _set(obj, path[-1], value)
+        self._set_path(obj, value)
 
     def __repr__(self):
         """Accessor representation."""
@@ -192,6 +338,81 @@ class Attr(object):
 
         return self.attr_type
 
+    def _compile_serializer(self, stream=False, fields=None):
+        """Compile the serialization of this attribute into a function.
+
+        The compiled function behaves as `serialize`, but takes the context as a dict and has the accessor, type
+        and context lookups resolved upfront.
+
+        :param stream: Serialize the items of lists lazily, see `Schema.iterencode`.
+        :param fields: Projection of the schema (or of the list of schemas) of the attribute, see `Schema.serialize`.
+        :return: Function of (value, context) that returns the serialized attribute value.
+        """
+        if not types.Type.is_type(self.attr_type):
+            constant = self.attr_type
+            return lambda value, context: constant
+
+        stream = self._stream(stream)
+        get = self.accessor._compile_getter()
+        attr_type = self.attr_type
+        if fields is not None:
+            type_serialize = _compile_projected(attr_type, fields)
+        elif getattr(attr_type.serialize, "__func__", None) is types.Type.serialize:
+            # The base type doesn't convert the value
+            type_serialize = None
+        elif _is_compiled(attr_type):
+            if stream:
+                type_serialize = lambda value, context: _stream_serializer(attr_type)(value, context)
+            else:
+                type_serialize = attr_type.__serializer__
+        elif isinstance(attr_type, types.List) and type(attr_type).serialize is types.List.serialize:
+            type_serialize = _compile_stream_list(attr_type) if stream else _compile_list(attr_type)
+        else:
+            type_serialize = _compile_call(attr_type.serialize)
+
+        required = self.required
+        exclude = self.exclude
+        has_default = hasattr(self, "default")
+        default = self._default
+
+        if not has_default and not exclude:
+            # Without a default a missing value is either raised or skipped by the schema, nothing else to handle
+            if type_serialize is None:
+                return get
+
+            def serialize(value, context):
+                return type_serialize(get(value, context), context)
+
+            return serialize
+
+        if type_serialize is None:
+            type_serialize = lambda value, context: value
+
+        def serialize(value, context):
+            try:
+                value = get(value, context)
+            except (AttributeError, KeyError):
+                if not has_default and required:
+                    raise
+                value = default()
+
+            value = type_serialize(value, context)
+            if value is None and has_default:
+                value = default()
+            if exclude and value in exclude:
+                raise ExcludedValueException()
+            return value
+
+        return serialize
+
+    def _stream(self, stream):
+        """Check if the attribute can be serialized lazily.
+
+        The value of an optional attribute, or of an attribute with a default or exclusions, is serialized eagerly.
+        Then its errors and its value are handled the same way as in `serialize`.
+        """
+        return stream and self.required and not hasattr(self, "default") and not self.exclude
+
     def deserialize(self, value, **kwargs):
         """Deserialize the attribute from a HAL structure.
 
@@ -219,6 +440,78 @@ class Attr(object):
         value = self.attr_type.deserialize(value, **kwargs)
         return self._default() if value is None and hasattr(self, "default") else value
 
+    def _compile_encoder(self):
+        """Compile the serialization of this attribute into JSON text.
+
+        :return: Function of (value, context) that returns the JSON text of the serialized attribute value.
+        """
+        if not types.Type.is_type(self.attr_type):
+            constant = self.attr_type
+            try:
+                encoded = _encode(constant)
+            except TypeError:
+                return lambda value, context: _encode(constant)
+            return lambda value, context: encoded
+
+        serialize = self._compile_serializer()
+        if hasattr(self, "default") or self.exclude:
+            # The default and the exclusions apply to the serialized value
+            return lambda value, context: _encode(serialize(value, context))
+
+        get = self.accessor._compile_getter()
+        attr_type = self.attr_type
+        if _is_compiled(attr_type):
+            type_dumps = lambda value, context: _encoder(attr_type)(value, context)
+        else:
+            dumps = types._get_dumps(attr_type)
+            if dumps is None:
+                return lambda value, context: _encode(serialize(value, context))
+            if isinstance(attr_type, types.List) and dumps.__func__ is types.List.dumps:
+                type_dumps = _compile_encode_list(attr_type)
+            else:
+                type_dumps = _compile_call(dumps)
+
+        def encode(value, context):
+            return type_dumps(get(value, context), context)
+
+        return encode
+
+    def _compile_deserializer(self):
+        """Compile the deserialization of this attribute into a function.
+
+        :return: Function of (value, context) that returns the deserialized attribute value.
+        """
+        compartment = self.compartment
+        get = self.accessor._compile_getter()
+
+        attr_type = self.attr_type
+        if _is_compiled(attr_type, "deserialize"):
+            type_deserialize = attr_type.__deserializer__
+        else:
+            type_deserialize = lambda value, context: attr_type.deserialize(value, **context)
+
+        required = self.required
+        has_default = hasattr(self, "default")
+        default = self._default
+
+        def deserialize(value, context):
+            if compartment is not None:
+                value = value[compartment]
+
+            try:
+                value = get(value, context)
+            except (KeyError, AttributeError):
+                if not has_default and required:
+                    raise
+                return default()
+
+            value = type_deserialize(value, context)
+            if value is None and has_default:
+                return default()
+            return value
+
+        return deserialize
+
     def __repr__(self):
         """Attribute representation."""
         return "<{0} '{1}'>".format(self.__class__.__name__, self.name)
@@ -240,6 +533,11 @@ class Attr(object):
         return self
 
 
+_attr_serialize = Attr.serialize
+_attr_deserialize = Attr.deserialize
+"""The stock attribute (de)serialization, attributes that replace it are not compiled."""
+
+
 def attr(*args, **kwargs):
     """Attribute as a decorator alias.
 
@@ -293,6 +591,8 @@ class Link(Attr):
             }
 
             class LinkSchema(Schema):
+                _link_schema = True
+
                 href = Attr(attr_type=attr_type, attr=BYPASS)
 
                 if attrs["templated"] is not None:
@@ -370,15 +670,26 @@ class Curie(object):
 class Embedded(Attr):
     """Embedded attribute of schema."""
 
-    def __init__(self, attr_type: Union["halogen.Schema", "halogen.types.List"], attr=None, curie=None, required=True):
+    def __init__(
+        self,
+        attr_type: Union["halogen.Schema", "halogen.types.List"],
+        attr=None,
+        curie=None,
+        required=True,
+        memoize: Union[bool, Callable] = False,
+    ):
         """Embedded constructor.
 
         :param attr_type: Type, Schema or constant that does the type conversion of the attribute.
         :param attr: Attribute name, dot-separated attribute path or an `Accessor` instance.
         :param curie: The curie used for this embedded attribute.
+        :param memoize: Serialize the same resource once per top-level serialization call and reuse the serialized
+            value. True memoizes the resources by their identity, a function of the resource returns the key to
+            memoize it by instead.
         """
         super(Embedded, self).__init__(attr_type=attr_type, attr=attr, required=required)
         self.curie = curie
+        self.memoize = memoize
         self.validate()
 
     @property
@@ -409,76 +720,796 @@ class Embedded(Attr):
         if class_attributes is not None and "self" not in class_attributes.keys():
             raise InvalidSchemaDefinition("Invalid HAL standard definition, need `self` link")
 
+    def _compile_serializer(self, stream=False, fields=None):
+        """Compile the serialization of the embedded resources, see `Attr._compile_serializer`.
+
+        The lazy serialization doesn't memoize the resources, their serialized values are consumed once.
+        """
+        if not self.memoize or self._stream(stream):
+            return super()._compile_serializer(stream=stream, fields=fields)
+        return self._compile_memoized(False, fields) or super()._compile_serializer(fields=fields)
+
+    def _compile_encoder(self):
+        """Compile the serialization of the embedded resources into JSON text, see `Attr._compile_encoder`."""
+        if not self.memoize:
+            return super()._compile_encoder()
+        return self._compile_memoized(True) or super()._compile_encoder()
+
+    def _compile_memoized(self, encode, fields=None):
+        """Compile the serialization of the embedded resources that serializes every resource once per call.
+
+        The serialized resources are shared by the places they are embedded at.
+
+        :param encode: Serialize the resources into JSON text.
+        :param fields: Projection of the schema of the resources.
+        :return: Function of (value, context) that returns the serialized resources, or None if the resources are
+            not serialized by the compiled schemas.
+        """
+        attr_type = self.attr_type
+        many = isinstance(attr_type, types.List)
+        if many:
+            if type(attr_type).serialize is not types.List.serialize or type(attr_type).dumps is not types.List.dumps:
+                return None
+            schema = attr_type.item_type
+        else:
+            schema = attr_type
+        if not _is_compiled(schema):
+            return None
+
+        get = self.accessor._compile_getter()
+        key = id if self.memoize is True else self.memoize
+
+        def serialize_resource(value, context):
+            memo = context.memo()
+            memo_key = (schema, encode, fields, key, key(value))
+            try:
+                return memo[memo_key][1]
+            except KeyError:
+                pass
+            # The serializers of the schema are looked up on a miss, they are compiled again by the profiler
+            if encode:
+                serialized = _encoder(schema)(value, context)
+            elif fields is None:
+                serialized = schema.__serializer__(value, context)
+            else:
+                serialized = _projection(schema, fields)(value, context)
+            # The resource is kept alive with the memo, its identity can't be reused during the call
+            memo[memo_key] = (value, serialized)
+            return serialized
+
+        if not many:
+            return lambda value, context: serialize_resource(get(value, context), context)
+
+        def serialize_resources(value, context):
+            value = get(value, context)
+            if value is None:
+                raise ValueError("None passed, use Nullable type for nullable values")
+            if encode:
+                return "[" + ", ".join([serialize_resource(item, context) for item in value]) + "]"
+            return [serialize_resource(item, context) for item in value]
+
+        return serialize_resources
+
 
 class _Schema(types.Type):
     """Type for creating schema."""
 
+    dict_class = dict
+    """Mapping type of the serialized values (and their compartments).
+
+    Plain dicts preserve the order of the attributes. For the code that expects `collections.OrderedDict` set it in the
+    class body of a schema, or on `halogen.Schema` before the schemas are defined. The links and the curies of the
+    schema follow its mapping type, the embedded schemas have their own.
+    """
+
+    cache = None
+    """Cache of the serialized values and of their JSON text, see `halogen.cache`.
+
+    Set it in the class body of a schema together with `cache_key`. Caches that don't copy their values (for example
+    `MemoryCache(copy_values=False)`) return the cached value itself, modifying it in place changes the cache.
+    """
+
+    cache_key = None
+    """Dot-separated path or function of the value that returns the key of the value in the cache."""
+
+    cache_version = None
+    """Dot-separated path or function of the value that returns its version, a new version is serialized again."""
+
+    cache_context = ()
+    """Names of the context arguments that the serialization depends on, the cache keeps the values per context."""
+
+    cache_namespace = None
+    """Name of the schema in the cache, the schema class itself by default. It is not inherited by the subclasses.
+
+    The schemas that share a `FileCache` are named after their class repr (the dotted path), set a unique namespace
+    for the ones that are defined in functions or created with `Schema(**attrs)`.
+    """
+
     def __new__(cls, **kwargs):
         """Create schema from keyword arguments."""
         schema = type("Schema", (cls,), {"__doc__": cls.__doc__})
-        schema.__class_attrs__ = OrderedDict()
-        schema.__attrs__ = OrderedDict()
+        schema.__class_attrs__ = {}
+        schema.__attrs__ = {}
         for name, attr in kwargs.items():
             if not hasattr(attr, "name"):
                 attr.name = name
             schema.__class_attrs__[attr.name] = attr
             schema.__attrs__[attr.name] = attr
+        schema.__serializer__ = _compile_serializer(schema)
+        schema.__deserializer__ = _compile_deserializer(schema)
         return schema
 
     @classmethod
-    def serialize(cls, value, **kwargs):
-        result = OrderedDict()
-        for attr in cls.__attrs__.values():
-            compartment = result
-            if attr.compartment is not None:
-                compartment = result.setdefault(attr.compartment, OrderedDict())
-            try:
-                compartment[attr.key] = attr.serialize(value, **kwargs)
-            except (AttributeError, KeyError):
-                if attr.required:
-                    raise
-            except ExcludedValueException:
-                pass
-            if attr.compartment is not None and len(compartment) == 0:
-                del result[attr.compartment]
-        return result
+    def serialize(cls, value, fields=None, **kwargs):
+        """Serialize the value into a HAL structure.
+
+        :param value: Value to serialize.
+        :param fields: Serialize only these fields, an iterable or a comma-separated string of dot-separated paths in
+            the HAL structure, for example "title", "_links.self" or "_embedded.author.name". The whitespace around the
+            fields is ignored. The getters of the other attributes are not called. The serialization of every projection
+            is compiled once.
+        :return: Serialized value.
+        :raises: ValueError if a field is unknown.
+        """
+        serialize = cls.__serializer__ if fields is None else _projection(cls, fields)
+        return serialize(value, _make_context(kwargs, _memoizes(cls)))
 
     @classmethod
-    def deserialize(cls, value, output=None, **kwargs):
+    def serialize_many(cls, values, fields=None, **kwargs):
+        """Serialize every value of an iterable.
+
+        The context is prepared once for all the values, which makes it faster than calling `serialize` in a loop.
+
+        :param values: Iterable of values to serialize, for example a list or a database cursor.
+        :param fields: Serialize only these fields, see `serialize`.
+        :return: List of serialized values.
+        """
+        if not _is_compiled(cls):
+            return [cls.serialize(value, **_with_fields(kwargs, fields)) for value in values]
+        serialize = cls.__serializer__ if fields is None else _projection(cls, fields)
+        context = _make_context(kwargs, _memoizes(cls))
+        return [serialize(value, context) for value in values]
+
+    @classmethod
+    def serialize_iter(cls, values, fields=None, **kwargs):
+        """Serialize the values of an iterable lazily.
+
+        The embedded resources are memoized per value (see `Embedded`), so the memory stays bounded however many
+        values are consumed.
+
+        :param values: Iterable of values to serialize, for example a database cursor.
+        :param fields: Serialize only these fields, see `serialize`.
+        :return: Generator of serialized values.
+        """
+        if not _is_compiled(cls):
+            return (cls.serialize(value, **_with_fields(kwargs, fields)) for value in values)
+        serialize = cls.__serializer__ if fields is None else _projection(cls, fields)
+        if not _memoizes(cls):
+            context = _make_context(kwargs)
+            return (serialize(value, context) for value in values)
+        return (serialize(value, _make_context(kwargs, True)) for value in values)
+
+    @classmethod
+    def iterencode(cls, value, **kwargs):
+        """Serialize the value into JSON text chunks.
+
+        The items of the lists of the required attributes (for example an `Embedded(types.List(...))`) are serialized
+        and encoded one at a time as the chunks are consumed, so a large collection can be written out with bounded
+        memory. Errors in these items are raised while iterating, after the preceding chunks. The optional attributes
+        are serialized before they are encoded, so they are left out on errors the same way as in `serialize`.
+
+        :param value: Value to serialize.
+        :return: Generator of JSON text chunks.
+        """
+        if not _is_compiled(cls):
+            serialized = cls.serialize(value, **kwargs)
+        else:
+            serialized = _stream_serializer(cls)(value, _make_context(kwargs))
+        buffer = []
+        size = 0
+        for fragment in _iterencode(serialized):
+            buffer.append(fragment)
+            size += len(fragment)
+            if size >= _CHUNK_SIZE:
+                yield "".join(buffer)
+                buffer = []
+                size = 0
+        if buffer:
+            yield "".join(buffer)
+
+    @classmethod
+    def dumps(cls, value, **kwargs):
+        """Serialize the value into JSON text.
+
+        The JSON text is written directly from the compiled schema, the same as `json.dumps(cls.serialize(value))`
+        but without building the intermediate dicts.
+
+        :param value: Value to serialize.
+        :return: JSON text.
+        """
+        if not _is_compiled(cls):
+            return _encode(cls.serialize(value, **kwargs))
+        return _encoder(cls)(value, _make_context(kwargs, _memoizes(cls)))
+
+    @classmethod
+    def dump(cls, value, fp, **kwargs):
+        """Serialize the value into JSON text chunks written to a file-like object, see `iterencode`.
+
+        :param value: Value to serialize.
+        :param fp: File-like object with a `write` method.
+        """
+        for chunk in cls.iterencode(value, **kwargs):
+            fp.write(chunk)
+
+    @classmethod
+    def deserialize(cls, value, output=None, fail_fast=False, max_errors=None, **kwargs):
         """Deserialize the HAL structure into the output value.
 
         :param value: Dict of already loaded json which will be deserialized by schema attributes.
         :param output: If present, the output object will be updated instead of returning the deserialized data.
+        :param fail_fast: Stop at the first validation error.
+        :param max_errors: Stop at this number of validation errors, nested schemas and lists share the limit.
 
         :returns: Dict of deserialized value for attributes. Where key is name of schema's attribute and value is
         deserialized value from value dict.
         :raises: ValidationError.
         """
+        if fail_fast or max_errors is not None:
+            with exceptions._limit_errors(fail_fast, max_errors):
+                return cls.__deserializer__(value, _make_context(kwargs), output)
+        return cls.__deserializer__(value, _make_context(kwargs), output)
+
+
+def _with_fields(kwargs, fields):
+    """Add the fields to the arguments of a schema that overrides `serialize`, if the fields are selected."""
+    return kwargs if fields is None else dict(kwargs, fields=fields)
+
+
+def _is_compiled(value, method="serialize"):
+    """Check if the value is a schema that uses its compiled (de)serializer."""
+    return isinstance(value, _SchemaType) and getattr(value, method).__func__ is getattr(_Schema, method).__func__
+
+
+def _compile_serializer(schema, stream=False, fields=None):
+    """Compile the serialization of the schema into a single function.
+
+    Compartments and keys of the attributes are resolved once, the attributes are compiled with
+    `Attr._compile_serializer`. Attributes that override `serialize` keep using it.
+
+    :param schema: Schema class.
+    :param stream: Serialize the items of lists lazily, see `Schema.iterencode`.
+    :param fields: Frozenset of the fields of the projection, the other attributes are left out of the plan.
+    :return: Function of (value, context) that returns the serialized value.
+    """
+    projection = None if fields is None else _split_fields(schema, fields)
+    plan = []
+    for attr in schema.__attrs__.values():
+        attr_fields = None
+        if projection is not None:
+            if attr not in projection:
+                continue
+            attr_fields = projection[attr]
+        compiled_attr = _with_dict_class(attr, schema.dict_class)
+        serialize_attr = None
+        if type(attr).serialize is _attr_serialize:
+            try:
+                serialize_attr = compiled_attr._compile_serializer(stream=stream, fields=attr_fields)
+            except TypeError:
+                # The signature of the getter or the type can't be inspected, serialize it the slow way
+                pass
+        if serialize_attr is None:
+            if attr_fields is not None:
+                raise ValueError("The fields of {0} can't be selected".format(attr.name))
+            serialize_attr = lambda value, context, attr=compiled_attr: attr.serialize(value, **context)
+        plan.append((attr.compartment, attr.key, attr.required, _profile(serialize_attr, "serialize", schema, attr)))
+
+    dict_class = schema.dict_class
+
+    def serialize(value, context):
+        result = dict_class()
+        for compartment, key, required, serialize_attr in plan:
+            try:
+                attr_value = serialize_attr(value, context)
+            except (AttributeError, KeyError):
+                if required:
+                    raise
+                continue
+            except ExcludedValueException:
+                continue
+
+            if compartment is None:
+                result[key] = attr_value
+            elif compartment in result:
+                result[compartment][key] = attr_value
+            else:
+                # Compartments only appear in the result when they get their first value
+                result[compartment] = dict_class(((key, attr_value),))
+        return result
+
+    if not stream and fields is None:
+        serialize = _compile_cached(serialize, "serialize", schema)
+    return _profile(serialize, "serialize", schema)
+
+
+def _with_dict_class(attr, dict_class):
+    """Return the attribute with the link schema that it creates serialized into the mapping type of the schema.
+
+    The schemas of the links and of the curies are created with `Schema`, they follow the `dict_class` of the schema
+    of their links. Their variants are created once per mapping type.
+
+    :param attr: Attribute of the schema.
+    :param dict_class: Mapping type of the schema.
+    :return: The attribute, or its copy with the variant of its link schema.
+    """
+    if not isinstance(attr, Link):
+        return attr
+    attr_type = attr.attr_type
+    is_list = isinstance(attr_type, types.List)
+    link_schema = attr_type.item_type if is_list else attr_type
+    if not getattr(link_schema, "_link_schema", False) or link_schema.dict_class is dict_class:
+        return attr
+    variants = link_schema.__dict__.get("__dict_class_variants__")
+    if variants is None:
+        variants = link_schema.__dict_class_variants__ = {}
+    variant = variants.get(dict_class)
+    if variant is None:
+        variant = variants[dict_class] = type(link_schema)(
+            link_schema.__name__, (link_schema,), {"__doc__": link_schema.__doc__, "dict_class": dict_class}
+        )
+    attr = copy.copy(attr)
+    attr.attr_type = types.List(variant) if is_list else variant
+    return attr
+
+
+_MAX_PROJECTIONS = 256
+"""Maximal number of the compiled projections of a schema, the older projections are compiled again."""
+
+
+def _projection(schema, fields):
+    """Return the serializer of the projection of the schema, it is compiled on first use.
+
+    :param schema: Schema class.
+    :param fields: Iterable or comma-separated string of the fields, see `Schema.serialize`.
+    """
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    fields = frozenset(field.strip() for field in fields) - {""}
+    projections = schema.__dict__.get("__projections__")
+    if projections is None:
+        projections = schema.__projections__ = {}
+    try:
+        return projections[fields]
+    except KeyError:
+        pass
+    if len(projections) >= _MAX_PROJECTIONS:
+        projections.clear()
+    serializer = projections[fields] = _compile_serializer(schema, fields=fields)
+    return serializer
+
+
+def _split_fields(schema, fields):
+    """Split the fields of the projection of the schema into the fields of its attributes.
+
+    :param schema: Schema class.
+    :param fields: Frozenset of the fields.
+    :return: Dict of the selected attributes to the frozensets of their fields, or to None for the whole attributes.
+    :raises: ValueError if a field doesn't select any attribute.
+    """
+    projection = {}
+    unknown = set(fields)
+    for attr in schema.__attrs__.values():
+        compartment = attr.compartment
+        path = attr.key if compartment is None else "{0}.{1}".format(compartment, attr.key)
+        prefix = path + "."
+        whole = False
+        attr_fields = set()
+        for field in fields:
+            if field == path or (compartment is not None and field == compartment):
+                whole = True
+            elif field.startswith(prefix):
+                attr_fields.add(field[len(prefix) :])
+            else:
+                continue
+            unknown.discard(field)
+        if whole:
+            projection[attr] = None
+        elif attr_fields:
+            projection[attr] = frozenset(attr_fields)
+    if unknown:
+        raise ValueError("Unknown fields: {0}".format(", ".join(sorted(unknown))))
+    return projection
+
+
+def _compile_projected(attr_type, fields):
+    """Compile the serialization of the projection of a schema or of a list of schemas.
+
+    :param attr_type: Schema class or `types.List` instance of a schema.
+    :param fields: Frozenset of the fields.
+    :return: Function of (value, context) that returns the serialized value.
+    """
+    if _is_compiled(attr_type):
+        return _projection(attr_type, fields)
+    if not (
+        isinstance(attr_type, types.List)
+        and type(attr_type).serialize is types.List.serialize
+        and _is_compiled(attr_type.item_type)
+    ):
+        raise ValueError("The fields of {0!r} can't be selected".format(attr_type))
+    serialize_item = _projection(attr_type.item_type, fields)
+
+    def serialize(value, context):
+        if value is None:
+            raise ValueError("None passed, use Nullable type for nullable values")
+        return [serialize_item(item, context) for item in value]
+
+    return serialize
+
+
+def _stream_serializer(schema):
+    """Return the streaming serializer of the schema, it is compiled on first use."""
+    try:
+        return schema.__dict__["__stream_serializer__"]
+    except KeyError:
+        serializer = schema.__stream_serializer__ = _compile_serializer(schema, stream=True)
+        return serializer
+
+
+def _compile_stream_list(list_type):
+    """Compile the lazy serialization of the items of a list type.
+
+    :param list_type: `types.List` instance.
+    :return: Function of (value, context) that returns a generator of serialized items.
+    """
+
+    def serialize(value, context):
+        if value is None:
+            raise ValueError("None passed, use Nullable type for nullable values")
+        item_type = list_type.item_type
+        if _is_compiled(item_type):
+            serialize_item = _stream_serializer(item_type)
+            return (serialize_item(item, context) for item in value)
+        if inspect.ismethod(getattr(item_type, "serialize_iter", None)):
+            return item_type.serialize_iter(value, **context)
+        return (item_type.serialize(item, **context) for item in value)
+
+    return serialize
+
+
+def _compile_list(list_type):
+    """Compile the serialization of the items of a list type, the items of schemas share the context of the call.
+
+    :param list_type: `types.List` instance.
+    :return: Function of (value, context) that returns the list of serialized items.
+    """
+
+    def serialize(value, context):
+        item_type = list_type.item_type
+        if value is None or not _is_compiled(item_type):
+            return list_type.serialize(value, **context)
+        serialize_item = item_type.__serializer__
+        return [serialize_item(item, context) for item in value]
+
+    return serialize
+
+
+def _memoizes(schema, seen=None):
+    """Check if the schema or its nested schemas memoize embedded resources, the result is cached on the schema."""
+    try:
+        return schema.__dict__["__memoize__"]
+    except KeyError:
+        pass
+    seen = set() if seen is None else seen
+    seen.add(schema)
+    memoize = False
+    for attr in schema.__attrs__.values():
+        attr_type = attr.attr_type
+        if isinstance(attr_type, types.List):
+            attr_type = attr_type.item_type
+        if getattr(attr, "memoize", False) or (
+            isinstance(attr_type, _SchemaType) and attr_type not in seen and _memoizes(attr_type, seen)
+        ):
+            memoize = True
+            break
+    schema.__memoize__ = memoize
+    return memoize
+
+
+def _compile_encoder(schema):
+    """Compile the serialization of the schema into JSON text.
+
+    The keys and the compartments are encoded once, the attributes are compiled with `Attr._compile_encoder`.
+
+    :param schema: Schema class.
+    :return: Function of (value, context) that returns the JSON text of the serialized value.
+    """
+    plan = []
+    for attr in schema.__attrs__.values():
+        encode_attr = None
+        if type(attr).serialize is _attr_serialize:
+            try:
+                encode_attr = attr._compile_encoder()
+            except TypeError:
+                # The signature of the getter or the type can't be inspected, serialize it the slow way
+                pass
+        if encode_attr is None:
+            encode_attr = lambda value, context, attr=attr: _encode(attr.serialize(value, **context))
+        compartment = attr.compartment
+        if compartment is not None:
+            compartment = (compartment, _encode(compartment) + ": {")
+        plan.append(
+            (compartment, _encode(attr.key) + ": ", attr.required, _profile(encode_attr, "dumps", schema, attr))
+        )
+
+    def encode(value, context):
+        members = []
+        compartments = {}
+        for compartment, key, required, encode_attr in plan:
+            try:
+                member = key + encode_attr(value, context)
+            except (AttributeError, KeyError):
+                if required:
+                    raise
+                continue
+            except ExcludedValueException:
+                continue
+
+            if compartment is None:
+                members.append(member)
+            elif compartment in compartments:
+                compartments[compartment].append(member)
+            else:
+                # Compartments only appear in the result when they get their first value
+                compartments[compartment] = [member]
+                members.append(compartment)
+
+        for index, member in enumerate(members):
+            if member.__class__ is tuple:
+                members[index] = member[1] + ", ".join(compartments[member]) + "}"
+        return "{" + ", ".join(members) + "}"
+
+    return _profile(_compile_cached(encode, "dumps", schema), "dumps", schema)
+
+
+def _encoder(schema):
+    """Return the JSON encoder of the schema, it is compiled on first use."""
+    try:
+        return schema.__dict__["__encoder__"]
+    except KeyError:
+        encoder = schema.__encoder__ = _compile_encoder(schema)
+        return encoder
+
+
+def _compile_encode_list(list_type):
+    """Compile the serialization of a list type into JSON text.
+
+    :param list_type: `types.List` instance.
+    :return: Function of (value, context) that returns the JSON array of the serialized items.
+    """
+
+    def encode(value, context):
+        item_type = list_type.item_type
+        if value is None or not _is_compiled(item_type):
+            return list_type.dumps(value, **context)
+        encode_item = _encoder(item_type)
+        return "[" + ", ".join([encode_item(item, context) for item in value]) + "]"
+
+    return encode
+
+
+_CHUNK_SIZE = 16384
+"""Minimal size of the JSON text chunks of `Schema.iterencode`."""
+
+_encode = types._encode
+
+
+def _encode_key(key):
+    """Encode a dict key the way the json module does."""
+    if isinstance(key, str):
+        return _encode(key)
+    if key is None or isinstance(key, (int, float)):
+        return '"' + _encode(key) + '"'
+    raise TypeError("keys must be str, int, float, bool or None, not {0}".format(key.__class__.__name__))
+
+
+def _iterencode(value):
+    """Encode a serialized value into JSON text fragments.
+
+    Generators are encoded as arrays, consuming them one item at a time.
+
+    :param value: Serialized value.
+    :return: Generator of JSON text fragments.
+    """
+    if isinstance(value, dict):
+        yield "{"
+        separator = ""
+        for key, item in value.items():
+            yield separator + _encode_key(key) + ": "
+            yield from _iterencode(item)
+            separator = ", "
+        yield "}"
+    elif isinstance(value, (list, tuple)) or inspect.isgenerator(value):
+        yield "["
+        separator = ""
+        for item in value:
+            yield separator
+            yield from _iterencode(item)
+            separator = ", "
+        yield "]"
+    else:
+        yield _encode(value)
+
+
+def _compile_deserializer(schema):
+    """Compile the deserialization of the schema into a single function.
+
+    Links are left out upfront, compartments of the attributes and their setters are resolved once.
+
+    :param schema: Schema class.
+    :return: Function of (value, context, output) that returns the deserialized value or updates the output.
+    """
+    plan = []
+    setters = []
+    for attr in schema.__attrs__.values():
+        deserialize_attr = None
+        attr_deserialize = type(attr).deserialize
+        if attr_deserialize is Link.deserialize:
+            # Links don't support deserialization
+            continue
+        if attr_deserialize is _attr_deserialize and types.Type.is_type(attr.attr_type):
+            try:
+                deserialize_attr = attr._compile_deserializer()
+            except TypeError:
+                # The signature of the getter can't be inspected, deserialize it the slow way
+                pass
+        if deserialize_attr is None:
+            deserialize_attr = lambda value, context, attr=attr: attr.deserialize(value, **context)
+        plan.append((attr.name, attr.required, _profile(deserialize_attr, "deserialize", schema, attr)))
+        setters.append((attr.name, attr.accessor.set))
+
+    def deserialize(value, context, output=None):
         errors = []
         result = {}
-        for attr in cls.__attrs__.values():
+        for name, required, deserialize_attr in plan:
             try:
-                result[attr.name] = attr.deserialize(value, **kwargs)
+                result[name] = deserialize_attr(value, context)
+                continue
             except NotImplementedError:
-                # Links don't support deserialization
                 continue
             except ValueError as e:
-                errors.append(exceptions.ValidationError(e, attr.name))
+                error = exceptions.ValidationError(e, name)
             except exceptions.ValidationError as e:
-                e.attr = attr.name
-                errors.append(e)
+                e.attr = name
+                error = e
             except (KeyError, AttributeError):
-                if attr.required:
-                    errors.append(exceptions.ValidationError("Missing attribute.", attr.name))
+                if not required:
+                    continue
+                error = exceptions.ValidationError("Missing attribute.", name)
+            errors.append(error)
+            if exceptions._spend(error):
+                break
 
         if errors:
-            raise exceptions.ValidationError(errors)
+            raise exceptions._collect(errors)
 
         if output is None:
             return result
-        for attr in cls.__attrs__.values():
-            if attr.name in result:
-                attr.accessor.set(output, result[attr.name])
+        for name, set_value in setters:
+            if name in result:
+                set_value(output, result[name])
+
+    return _profile(deserialize, "deserialize", schema)
+
+
+def _cache_getter(getter):
+    """Compile the cache key or the cache version of a schema into a function of the value.
+
+    :param getter: Dot-separated path, function of the value or None.
+    """
+    if getter is None:
+        return lambda value: None
+    if isinstance(getter, str):
+        return _compile_path_getter(getter)
+    return getter
+
+
+def _cache_label(schema):
+    """Return the label of the schema in the cache keys, see `Schema.cache_namespace`."""
+    namespace = schema.__dict__.get("cache_namespace")
+    return schema if namespace is None else namespace
+
+
+def _cache_group(schema, key):
+    """Return the group of the cached values of an object, they are invalidated together."""
+    return (_cache_label(schema), key)
+
+
+def _compile_cached(function, operation, schema):
+    """Wrap a compiled function of the schema into its cache, when the schema has a cache.
+
+    :param function: Compiled function of (value, context) of the schema.
+    :param operation: Name of the operation, "serialize" or "dumps".
+    :param schema: Schema class.
+    :return: The function, or the function that looks up its values in the cache first.
+    """
+    cache = schema.cache
+    if cache is None:
+        return function
+    if schema.cache_key is None:
+        raise InvalidSchemaDefinition("The cache of {0} requires a cache_key".format(schema.__qualname__))
+
+    label = _cache_label(schema)
+    get_key = _cache_getter(schema.cache_key)
+    get_version = _cache_getter(schema.cache_version)
+    names = tuple(schema.cache_context)
+
+    def cached(value, context):
+        if value is None:
+            return function(value, context)
+        group = (label, get_key(value))
+        key = (operation, get_version(value), tuple([context.get(name) for name in names]) if names else ())
+        try:
+            return cache.get(group, key)
+        except KeyError:
+            pass
+        serialized = function(value, context)
+        cache.set(group, key, serialized)
+        return serialized
+
+    return cached
+
+
+_profiler = None
+"""Profiler that the schemas are compiled with, see `halogen.profile.Profiler`."""
+
+
+def _profile(function, operation, schema, attr=None):
+    """Wrap a compiled function of the schema or of its attribute into the profiler when it is enabled.
+
+    :param function: Compiled function.
+    :param operation: Name of the operation, "serialize", "dumps" or "deserialize".
+    :param schema: Schema class.
+    :param attr: Attribute of the schema, or None for the function of the schema itself.
+    :return: The function, or the function that records its calls.
+    """
+    if _profiler is None:
+        return function
+    return _profiler.wrap(function, operation, schema, attr)
+
+
+def _recompile():
+    """Compile the (de)serializers of all the schemas again, after the profiler is enabled or disabled.
+
+    The nested schemas (and the schemas of the nested lists) are compiled before the schemas that embed them.
+    """
+    compiled = set()
+
+    def compile_schema(schema):
+        if schema in compiled:
+            return
+        compiled.add(schema)
+        if "__serializer__" not in schema.__dict__:
+            # The definition of the schema failed
+            return
+        for attr in schema.__attrs__.values():
+            attr_type = attr.attr_type
+            if isinstance(attr_type, types.List):
+                attr_type = attr_type.item_type
+            if isinstance(attr_type, _SchemaType):
+                compile_schema(attr_type)
+                for variant in attr_type.__dict__.get("__dict_class_variants__", {}).values():
+                    compile_schema(variant)
+        schema.__serializer__ = _compile_serializer(schema)
+        schema.__deserializer__ = _compile_deserializer(schema)
+        # The encoders, the streaming serializers and the projections are compiled again on first use
+        for name in ("__encoder__", "__stream_serializer__", "__projections__"):
+            if name in schema.__dict__:
+                delattr(schema, name)
+
+    pending = [Schema]
+    while pending:
+        schema = pending.pop()
+        compile_schema(schema)
+        pending.extend(schema.__subclasses__())
 
 
 class _SchemaType(type):
@@ -486,7 +1517,7 @@ class _SchemaType(type):
 
     def __init__(cls, name, bases, clsattrs):
         """Create a new _SchemaType."""
-        cls.__class_attrs__ = OrderedDict()
+        cls.__class_attrs__ = {}
         curies = set([])
 
         attrs = [(key, value) for key, value in clsattrs.items() if isinstance(value, Attr)]
@@ -507,18 +1538,19 @@ class _SchemaType(type):
         # Collect CURIEs and create the link attribute
 
         if curies:
-            link = LinkList(
-                Schema(href=Attr(), name=Attr(), templated=Attr(required=False), type=Attr(required=False)),
-                attr=lambda value: list(curies),
-                required=False,
-            )
+            curie_schema = Schema(href=Attr(), name=Attr(), templated=Attr(required=False), type=Attr(required=False))
+            curie_schema._link_schema = True
+            link = LinkList(curie_schema, attr=lambda value: list(curies), required=False)
             link.name = "curies"
 
             cls.__class_attrs__[link.name] = link
 
-        cls.__attrs__ = OrderedDict()
+        cls.__attrs__ = {}
         for base in reversed(cls.__mro__):
-            cls.__attrs__.update(getattr(base, "__class_attrs__", OrderedDict()))
+            cls.__attrs__.update(getattr(base, "__class_attrs__", {}))
+
+        cls.__serializer__ = _compile_serializer(cls)
+        cls.__deserializer__ = _compile_deserializer(cls)
 
 
 Schema = _SchemaType("Schema", (_Schema,), {"__doc__": _Schema.__doc__})
@@ -1,20 +1,106 @@
 """Halogen basic types."""
 
+import copy
 import datetime
 import decimal
 import enum
+import functools
+import inspect
+import json
+import re
 import typing
 from typing import Union, Optional, Any
 
-import dateutil.parser
-import isodate
-import pytz
-
-from .exceptions import ValidationError
+from .exceptions import ValidationError, _collect, _limit_errors, _spend
 
 if typing.TYPE_CHECKING:
     from .schema import _Schema
 
+_encode = json.JSONEncoder().encode
+_encode_string = json.encoder.encode_basestring_ascii
+
+_UTC = datetime.timezone.utc
+_DATETIME_FORMAT = "%04d-%02d-%02dT%02d:%02d:%02d"
+_UTC_DATETIME_FORMAT = _DATETIME_FORMAT + "Z"
+
+_AMOUNT_FIELDS = frozenset(("currency", "amount"))
+
+_ISO_DATETIME = re.compile(
+    r"([0-9]{4})-([0-9]{2})-([0-9]{2})T([0-9]{2}):([0-9]{2}):([0-9]{2})(?:\.([0-9]{1,6}))?"
+    r"(?:(Z)|([+-])([0-9]{2}):([0-9]{2}))?\Z"
+)
+_ISO_DATE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})\Z")
+
+
+def _parse_datetime(value):
+    """Parse the common extended format of the ISO-8601 datetime, return None for the other formats."""
+    match = _ISO_DATETIME.match(value)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction, utc, sign, offset_hours, offset_minutes = match.groups()
+    if utc is not None:
+        tzinfo = datetime.timezone.utc
+    elif sign is not None:
+        offset = datetime.timedelta(hours=int(offset_hours), minutes=int(offset_minutes))
+        tzinfo = datetime.timezone(-offset if sign == "-" else offset)
+    else:
+        tzinfo = None
+    return datetime.datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour),
+        int(minute),
+        int(second),
+        int(fraction.ljust(6, "0")) if fraction is not None else 0,
+        tzinfo,
+    )
+
+
+def _parse_date(value):
+    """Parse the extended format of the ISO-8601 date, return None for the other formats."""
+    match = _ISO_DATE.match(value)
+    if match is None:
+        return None
+    year, month, day = match.groups()
+    return datetime.date(int(year), int(month), int(day))
+
+
+_ISO_PARSERS = {"datetime": _parse_datetime, "date": _parse_date}
+
+
+def _parse_iso(value, type, message):
+    """Parse the ISO-8601 value of the datetime or date type.
+
+    The common format is parsed in a single pass, the rest of the values and the invalid ones are left
+    to the lenient parsers. They are imported on first use to keep the import of halogen fast. The parsed
+    datetimes carry a `datetime.timezone` in both cases.
+    """
+    parse = _ISO_PARSERS.get(type)
+    if parse is not None and isinstance(value, str):
+        try:
+            parsed = parse(value)
+        except ValueError:
+            parsed = None
+        if parsed is not None:
+            return parsed
+
+    import dateutil.parser
+    import isodate
+
+    try:
+        dateutil.parser.parse(value)
+        parsed = getattr(isodate, "parse_{0}".format(type))(value)
+    except (isodate.ISO8601Error, ValueError):
+        raise ValueError(message.format(val=value))
+
+    tzinfo = getattr(parsed, "tzinfo", None)
+    if tzinfo is not None and not isinstance(tzinfo, datetime.timezone):
+        # The isodate Utc and FixedOffset have a fixed offset
+        offset = parsed.utcoffset()
+        parsed = parsed.replace(tzinfo=_UTC if not offset else datetime.timezone(offset))
+    return parsed
+
 
 class Type(object):
     """Base class for creating types."""
@@ -26,28 +112,59 @@ class Type(object):
             deserialized value. Validators raise :class:`halogen.exception.ValidationError` exceptions when
             value is not valid.
         """
-        self.validators = [] if validators is None else list(validators)
+        self.validators = () if validators is None else validators
+
+    @property
+    def validators(self):
+        """Validators of the deserialized value."""
+        return self._validators
+
+    @validators.setter
+    def validators(self, validators):
+        self._validators = tuple(validators)
+        self._validate = _compile_validators(self._validators)
 
     def serialize(self, value, **kwargs):
         """Serialization of value."""
         return value
 
-    def deserialize(self, value, **kwargs):
+    def serialize_many(self, values, **kwargs):
+        """Serialization of every value of an iterable.
+
+        :return: List of serialized values.
+        """
+        serialize = self.serialize
+        return [serialize(value, **kwargs) for value in values]
+
+    def serialize_iter(self, values, **kwargs):
+        """Lazy serialization of the values of an iterable.
+
+        :return: Generator of serialized values.
+        """
+        serialize = self.serialize
+        return (serialize(value, **kwargs) for value in values)
+
+    def dumps(self, value, **kwargs):
+        """Serialization of value into JSON text.
+
+        Types override it to emit the JSON text of the value directly, without encoding the serialized value.
+        """
+        return _encode(self.serialize(value, **kwargs))
+
+    def deserialize(self, value, fail_fast=False, max_errors=None, **kwargs):
         """Deserialization of value.
 
+        :param fail_fast: Stop at the first validation error.
+        :param max_errors: Stop at this number of validation errors.
         :return: Deserialized value.
         :raises: :class:`halogen.exception.ValidationError` exception if value is not valid.
         """
-        validation_exceptions = []
-        for validator in self.validators:
-            try:
-                validator.validate(value, **kwargs)
-            except ValidationError as e:
-                validation_exceptions.append(e)
-
-        if len(validation_exceptions) > 0:
-            raise ValidationError(validation_exceptions)
-
+        if self._validate is not None:
+            if fail_fast or max_errors is not None:
+                with _limit_errors(fail_fast, max_errors):
+                    self._validate(value, **kwargs)
+            else:
+                self._validate(value, **kwargs)
         return value
 
     @staticmethod
@@ -58,6 +175,82 @@ class Type(object):
         return isinstance(value, Type)
 
 
+def _compile_validators(validators):
+    """Compile the validators into a single function that raises the errors of all of them.
+
+    :return: Function that validates the value or None if there are no validators.
+    """
+    if not validators:
+        return None
+
+    if len(validators) == 1:
+        (validator,) = validators
+
+        def validate(value, **kwargs):
+            try:
+                validator.validate(value, **kwargs)
+            except ValidationError as e:
+                _spend(e)
+                raise _collect([e])
+
+        return validate
+
+    def validate(value, **kwargs):
+        errors = []
+        for validator in validators:
+            try:
+                validator.validate(value, **kwargs)
+            except ValidationError as e:
+                errors.append(e)
+                if _spend(e):
+                    break
+        if errors:
+            raise _collect(errors)
+
+    return validate
+
+
+def _owner(cls, name):
+    """Return the class in the MRO of the class that defines the attribute."""
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            return base
+
+
+def _get_dumps(type_):
+    """Return the function that emits the JSON text of the values of a type.
+
+    :return: `dumps` of the type or None if the type doesn't emit JSON text itself, or if it overrides `serialize`
+        without overriding `dumps`. Then the serialized value has to be encoded instead.
+    """
+    cls = type_ if isinstance(type_, type) else type(type_)
+    dumps = getattr(type_, "dumps", None)
+    if not (isinstance(type_, Type) or inspect.ismethod(dumps)):
+        return None
+    dumps_owner = _owner(cls, "dumps")
+    serialize_owner = _owner(cls, "serialize")
+    if dumps_owner in (None, Type) or serialize_owner is None or not issubclass(dumps_owner, serialize_owner):
+        return None
+    return dumps
+
+
+def _get_serialize_many(type_):
+    """Return the function that serializes many values of a type at once.
+
+    :return: `serialize_many` of the type or None if the type doesn't have it, or if it overrides `serialize` without
+        overriding `serialize_many`.
+    """
+    serialize_many = getattr(type_, "serialize_many", None)
+    if not inspect.ismethod(serialize_many):
+        return None
+    cls = type_ if isinstance(type_, type) else type(type_)
+    serialize_many_owner = _owner(cls, "serialize_many")
+    serialize_owner = _owner(cls, "serialize")
+    if serialize_many_owner is None or serialize_owner is None or not issubclass(serialize_many_owner, serialize_owner):
+        return None
+    return serialize_many
+
+
 class List(Type):
     """List type for Halogen schema attribute."""
 
@@ -75,10 +268,34 @@ class List(Type):
         """Serialize every item of the list."""
         if value is None:
             raise ValueError("None passed, use Nullable type for nullable values")
+        serialize_many = _get_serialize_many(self.item_type)
+        if serialize_many is not None:
+            return super().serialize(serialize_many(value, **kwargs), **kwargs)
         return super().serialize([self.item_type.serialize(val, **kwargs) for val in value], **kwargs)
 
-    def deserialize(self, value, **kwargs):
-        """Deserialize every item of the list."""
+    def dumps(self, value, **kwargs):
+        """Emit the JSON array of the serialized items."""
+        if value is None:
+            raise ValueError("None passed, use Nullable type for nullable values")
+        dumps = _get_dumps(self.item_type)
+        if dumps is None:
+            serialize = self.item_type.serialize
+            return "[" + ", ".join([_encode(serialize(val, **kwargs)) for val in value]) + "]"
+        return "[" + ", ".join([dumps(val, **kwargs) for val in value]) + "]"
+
+    def deserialize(self, value, fail_fast=False, max_errors=None, **kwargs):
+        """Deserialize every item of the list.
+
+        :param fail_fast: Stop at the first validation error.
+        :param max_errors: Stop at this number of validation errors.
+        """
+        if fail_fast or max_errors is not None:
+            with _limit_errors(fail_fast, max_errors):
+                return self._deserialize(value, **kwargs)
+        return self._deserialize(value, **kwargs)
+
+    def _deserialize(self, value, **kwargs):
+        """Deserialize every item of the list within the error budget."""
         if value is None:
             raise ValueError("None passed, use Nullable type for nullable values")
 
@@ -87,7 +304,13 @@ class List(Type):
                 value = [value]
             else:
                 raise ValidationError('"{}" is not a list'.format(value))
-        value = super().deserialize(value)
+        if self._validate is not None:
+            self._validate(value, **kwargs)
+
+        split = None if kwargs else self._split_item_validators()
+        if split is not None:
+            return self._deserialize_validate_many(value, *split)
+
         result = []
         errors = []
 
@@ -97,9 +320,65 @@ class List(Type):
             except ValidationError as exc:
                 exc.index = index
                 errors.append(exc)
+                if _spend(exc):
+                    break
         if errors:
-            raise ValidationError(errors)
-        return super().deserialize(result, **kwargs)
+            raise _collect(errors)
+        return result
+
+    def _split_item_validators(self):
+        """Return the validators split off the item type, see `_split_validators`.
+
+        The split is made once and made again when the item type or its validators change.
+        """
+        item_type = self.item_type
+        validate = getattr(item_type, "_validate", None)
+        cached = self.__dict__.get("_split")
+        if cached is not None and cached[0] is item_type and cached[1] is validate:
+            return cached[2]
+        split = _split_validators(item_type)
+        self._split = (item_type, validate, split)
+        return split
+
+    def _deserialize_validate_many(self, value, item_type, validators):
+        """Deserialize every item of the list with the item type without validators, then validate the items at once.
+
+        :param item_type: Copy of the item type without validators.
+        :param validators: Validators of the item type.
+        """
+        result = []
+        indices = []
+        errors = {}
+
+        for index, val in enumerate(value):
+            try:
+                result.append(item_type.deserialize(val))
+            except ValidationError as exc:
+                exc.index = index
+                errors[index] = exc
+                if _spend(exc):
+                    raise _collect([errors[index] for index in sorted(errors)])
+            else:
+                indices.append(index)
+
+        item_errors = {}
+        spent = False
+        for validator in validators:
+            for error in validator.validate_many(result):
+                index = indices[error.index]
+                error.index = None
+                item_errors.setdefault(index, []).append(error)
+                spent = _spend(error)
+                if spent:
+                    break
+            if spent:
+                break
+        for index, item_error in item_errors.items():
+            errors[index] = ValidationError(item_error, index=index)
+
+        if errors:
+            raise _collect([errors[index] for index in sorted(errors)])
+        return result
 
 
 class ISODateTime(Type):
@@ -119,11 +398,7 @@ class ISODateTime(Type):
             raise ValueError("None passed, use Nullable type for nullable values")
 
         value = value() if callable(value) else value
-        try:
-            dateutil.parser.parse(value)
-            value = getattr(isodate, "parse_{0}".format(self.type))(value)
-        except (isodate.ISO8601Error, ValueError):
-            raise ValueError(self.message.format(val=value))
+        value = _parse_iso(value, self.type, self.message)
 
         return super().deserialize(value)
 
@@ -136,9 +411,14 @@ class ISOUTCDateTime(Type):
 
     def format_as_utc(self, value):
         """Format UTC times."""
+        if type(value) is datetime.datetime:
+            if value.tzinfo is None:
+                return _DATETIME_FORMAT % (value.year, value.month, value.day, value.hour, value.minute, value.second)
+            value = value.astimezone(_UTC)
+            return _UTC_DATETIME_FORMAT % (value.year, value.month, value.day, value.hour, value.minute, value.second)
         if isinstance(value, datetime.datetime):
             if value.tzinfo is not None:
-                value = value.astimezone(pytz.UTC)
+                value = value.astimezone(_UTC)
             value = value.replace(microsecond=0)
         return value.isoformat().replace("+00:00", "Z")
 
@@ -148,16 +428,33 @@ class ISOUTCDateTime(Type):
 
         return super().serialize(self.format_as_utc(value), **kwargs)
 
+    def serialize_many(self, values, **kwargs):
+        """Format every datetime of an iterable.
+
+        :return: List of formatted datetimes.
+        """
+        if _owner(type(self), "serialize") is not ISOUTCDateTime:
+            return super().serialize_many(values, **kwargs)
+        format_as_utc = self.format_as_utc
+        serialized = []
+        append = serialized.append
+        for value in values:
+            if value is None:
+                raise ValueError("None passed, use Nullable type for nullable values")
+            append(format_as_utc(value))
+        return serialized
+
+    def dumps(self, value, **kwargs):
+        if value is None:
+            raise ValueError("None passed, use Nullable type for nullable values")
+        return '"' + self.format_as_utc(value) + '"'
+
     def deserialize(self, value, **kwargs):
         if value is None:
             raise ValueError("None passed, use Nullable type for nullable values")
 
         value = value() if callable(value) else value
-        try:
-            dateutil.parser.parse(value)
-            value = getattr(isodate, "parse_{0}".format(self.type))(value)
-        except (isodate.ISO8601Error, ValueError):
-            raise ValueError(self.message.format(val=value))
+        value = _parse_iso(value, self.type, self.message)
 
         return super().deserialize(value)
 
@@ -173,11 +470,20 @@ class String(Type):
     """String schema type."""
 
     def serialize(self, value, **kwargs):
+        if type(value) is str:
+            return value
         if value is None:
             raise ValueError("None passed, use Nullable type for nullable values")
         return super().serialize(str(value), **kwargs)
 
+    def dumps(self, value, **kwargs):
+        if value is None:
+            raise ValueError("None passed, use Nullable type for nullable values")
+        return _encode_string(str(value))
+
     def deserialize(self, value, **kwargs):
+        if type(value) is str and self._validate is None:
+            return value
         if value is None:
             raise ValueError("None passed, use Nullable type for nullable values")
         return super().deserialize(str(value), **kwargs)
@@ -187,11 +493,20 @@ class Int(Type):
     """Int schema type."""
 
     def serialize(self, value, **kwargs):
+        if type(value) is int:
+            return value
         if value is None:
             raise ValueError("None passed, use Nullable type for nullable values")
         return super().serialize(int(value), **kwargs)
 
+    def dumps(self, value, **kwargs):
+        if value is None:
+            raise ValueError("None passed, use Nullable type for nullable values")
+        return int.__repr__(int(value))
+
     def deserialize(self, value, **kwargs):
+        if type(value) is int and self._validate is None:
+            return value
         if value is None:
             raise ValueError("None passed, use Nullable type for nullable values")
         try:
@@ -205,11 +520,20 @@ class Boolean(Type):
     """Boolean schema type."""
 
     def serialize(self, value, **kwargs):
+        if type(value) is bool:
+            return value
         if value is None:
             raise ValueError("None passed, use Nullable type for nullable values")
         return super().serialize(bool(value), **kwargs)
 
+    def dumps(self, value, **kwargs):
+        if value is None:
+            raise ValueError("None passed, use Nullable type for nullable values")
+        return "true" if value else "false"
+
     def deserialize(self, value: Union[str, int, bool, None], **kwargs):
+        if type(value) is bool and self._validate is None:
+            return value
         if value is None:
             raise ValueError("None passed, use Nullable type for nullable values")
 
@@ -239,14 +563,18 @@ class Amount(Type):
 
     err_unknown_currency = "'{currency}' is not a valid currency."
 
-    def __init__(self, currencies, amount_class, **kwargs):
+    def __init__(self, currencies, amount_class, cache_size=None, **kwargs):
         """Initialize new instance of Amount.
 
         :param currencies: list of all possible currency codes.
         :param amount_class: class for the Amount deserialized value.
+        :param cache_size: size of the cache of the parsed amounts, disabled by default. The cached instances of
+            the `amount_class` are shared between the deserialized values, so it has to be immutable.
         """
-        self.currencies = currencies
+        self.currencies = frozenset(currencies)
         self.amount_class = amount_class
+        self.cache_size = cache_size
+        self._parse_cached = functools.lru_cache(maxsize=cache_size)(self._parse) if cache_size else None
         super().__init__(**kwargs)
 
     def amount_object_to_dict(self, amount) -> dict[str, str]:
@@ -264,7 +592,7 @@ class Amount(Type):
             if not isinstance(amount, dict)
             else (amount["currency"], amount["amount"])
         )
-        if currency not in self.currencies:
+        if not self._is_currency(currency):
             raise ValueError(self.err_unknown_currency.format(currency=currency))
         return {
             "amount": str(amount),
@@ -283,6 +611,57 @@ class Amount(Type):
 
         return super().serialize(self.amount_object_to_dict(value), **kwargs)
 
+    def serialize_many(self, values, **kwargs):
+        """Serialize every amount of an iterable.
+
+        Amounts that are repeated in the iterable are quantized and converted once.
+
+        :param values: Amount values.
+
+        :return: List of converted amounts.
+        """
+        cls = type(self)
+        if _owner(cls, "serialize") is not Amount or _owner(cls, "amount_object_to_dict") is not Amount:
+            return super().serialize_many(values, **kwargs)
+
+        amount_object_to_dict = self.amount_object_to_dict
+        converted = {}
+        serialized = []
+        append = serialized.append
+        for value in values:
+            if value is None:
+                raise ValueError("None passed, use Nullable type for nullable values")
+            if isinstance(value, dict):
+                append(amount_object_to_dict(value))
+                continue
+            key = value.currency, value.amount
+            try:
+                amount, currency = converted[key]
+            except KeyError:
+                value = amount_object_to_dict(value)
+                converted[key] = value["amount"], value["currency"]
+                append(value)
+            except TypeError:
+                append(amount_object_to_dict(value))
+            else:
+                append({"amount": amount, "currency": currency})
+        return serialized
+
+    def dumps(self, value, **kwargs):
+        """Emit the JSON object of the amount.
+
+        :param value: Amount value.
+
+        :return: JSON text of the converted amount.
+        """
+        if value is None:
+            raise ValueError("None passed, use Nullable type for nullable values")
+
+        value = self.amount_object_to_dict(value)
+        return (
+            '{"amount": ' + _encode_string(value["amount"]) + ', "currency": ' + _encode_string(value["currency"]) + "}"
+        )
+
     def deserialize(self, value, **kwargs):
         """Deserialize the amount.
 
@@ -300,14 +679,29 @@ class Amount(Type):
             currency = value[:3]
             amount = value[3:]
         elif isinstance(value, dict):
-            if set(value.keys()) != set(("currency", "amount")):
+            if value.keys() != _AMOUNT_FIELDS:
                 raise ValueError("Amount object has to have currency and amount fields.")
             amount = value["amount"]
             currency = value["currency"]
         else:
             raise ValueError("Value cannot be parsed to Amount.")
 
-        if currency not in self.currencies:
+        if self._parse_cached is not None and isinstance(currency, str) and isinstance(amount, str):
+            value = self._parse_cached(currency, amount)
+        else:
+            value = self._parse(currency, amount)
+        return super().deserialize(value)
+
+    def _is_currency(self, currency):
+        """Check that the currency is one of the possible currencies."""
+        try:
+            return currency in self.currencies
+        except TypeError:
+            return False
+
+    def _parse(self, currency, amount):
+        """Parse the amount of the currency into the `amount_class` instance."""
+        if not self._is_currency(currency):
             raise ValueError(self.err_unknown_currency.format(currency=currency))
 
         try:
@@ -318,8 +712,7 @@ class Amount(Type):
         if amount.as_tuple().exponent < -2:
             raise ValueError("'{amount}' has more than 2 decimal places.".format(amount=amount))
 
-        value = self.amount_class(currency=currency, amount=amount)
-        return super().deserialize(value)
+        return self.amount_class(currency=currency, amount=amount)
 
 
 class Nullable(Type):
@@ -334,12 +727,55 @@ class Nullable(Type):
             return None
         return self.nested_type.serialize(value, **kwargs)
 
+    def dumps(self, value: Optional[Any], **kwargs):
+        if value is None:
+            return "null"
+        dumps = _get_dumps(self.nested_type)
+        if dumps is None:
+            return _encode(self.nested_type.serialize(value, **kwargs))
+        return dumps(value, **kwargs)
+
     def deserialize(self, value: Optional[Any], **kwargs):
         if value is None:
             return None
         return self.nested_type.deserialize(value, **kwargs)
 
 
+def _validates_many(validator):
+    """Check if the validator validates many values at once the same way it validates a single value.
+
+    A subclass that overrides `validate` but inherits `validate_many` has to validate the values one by one.
+    """
+    cls = type(validator)
+    validate_many_owner = _owner(cls, "validate_many")
+    validate_owner = _owner(cls, "validate")
+    return (
+        validate_many_owner is not None
+        and validate_owner is not None
+        and issubclass(validate_many_owner, validate_owner)
+    )
+
+
+def _split_validators(type_):
+    """Split the validators off the type, so that the values of a list can be validated at once.
+
+    :return: Copy of the type without validators and the validators of the type, or None if the validators can't
+        validate the values at once. That is the case when there are no validators, when a validator doesn't
+        implement `validate_many` (or overrides `validate` without overriding it) or when the type doesn't validate
+        the deserialized value as the last step.
+    """
+    if not isinstance(type_, Type) or type_._validate is None:
+        return None
+    if _owner(type(type_), "deserialize") not in _VALIDATE_DESERIALIZED:
+        return None
+    validators = type_.validators
+    if not all(_validates_many(validator) for validator in validators):
+        return None
+    type_ = copy.copy(type_)
+    type_.validators = ()
+    return type_, validators
+
+
 class Enum(Type):
     """Enum schema type for enum.Enum."""
 
@@ -348,32 +784,112 @@ class Enum(Type):
         enum_type: type[enum.Enum],
         use_values: bool = False,
         *args,
+        case_sensitive: bool = True,
+        aliases: Optional[dict[Any, enum.Enum]] = None,
         **kwargs,
     ):
+        """Create a new Enum.
+
+        :param enum_type: Enum class.
+        :param use_values: Serialize the members to their values instead of their names.
+        :param case_sensitive: Match the serialized string names or values case sensitively.
+        :param aliases: Additional serialized values that are deserialized to the members.
+        """
         super().__init__(*args, **kwargs)
         if not issubclass(enum_type, enum.Enum):
             raise TypeError("Must be subclass of enum.Enum.")
         self.enum_type = enum_type
         self.use_values = use_values
+        self.case_sensitive = case_sensitive
+        self.aliases = aliases
+        self._encoded = {}
+
+        self._serialized = {member: member.value if use_values else member.name for member in enum_type}
+        if use_values:
+            members = {}
+            for member in enum_type:
+                try:
+                    members[member.value] = member
+                except TypeError:  # Unhashable values are looked up in the enum class
+                    pass
+        else:
+            members = dict(enum_type.__members__)
+        members.update(aliases or {})
+        self._members = members
+        self._members_folded = (
+            None
+            if case_sensitive
+            else {key.lower(): member for key, member in reversed(members.items()) if isinstance(key, str)}
+        )
 
     def serialize(self, value: Optional[enum.Enum], **kwargs):
         if value is None:
             raise ValueError("None passed, use Nullable type for nullable values")
 
-        value = value.value if self.use_values else value.name
+        # The values that only compare equal to the members (for example the ints of an IntEnum) are not members, the
+        # composite values of a Flag are members that aren't in the lookup table
+        serialized = self._serialized
+        if type(value) is self.enum_type and value in serialized:
+            value = serialized[value]
+        else:
+            value = value.value if self.use_values else value.name
 
         return super().serialize(value, **kwargs)
 
+    def serialize_many(self, values, **kwargs):
+        """Serialization of every member of an iterable.
+
+        :return: List of serialized members.
+        """
+        if _owner(type(self), "serialize") is not Enum:
+            return super().serialize_many(values, **kwargs)
+        enum_type = self.enum_type
+        serialized = self._serialized
+        serialize = self.serialize
+        result = []
+        append = result.append
+        for value in values:
+            if type(value) is enum_type and value in serialized:
+                append(serialized[value])
+            else:
+                append(serialize(value, **kwargs))
+        return result
+
+    def dumps(self, value: Optional[enum.Enum], **kwargs):
+        """Emit the JSON text of the enum member, it is encoded once per member."""
+        if type(value) is not self.enum_type:
+            return _encode(self.serialize(value, **kwargs))
+        try:
+            return self._encoded[value]
+        except KeyError:
+            encoded = self._encoded[value] = _encode(self.serialize(value, **kwargs))
+            return encoded
+
     def deserialize(self, value: Optional[str], **kwargs):
         if value is None:
             raise ValueError("None passed, use Nullable type for nullable values")
 
-        if self.use_values:
-            value = self.enum_type(value)
-        else:
+        try:
+            value = self._members[value]
+        except (KeyError, TypeError):
+            value = self._lookup(value)
+
+        return super().deserialize(value, **kwargs)
+
+    def _lookup(self, value):
+        """Look the member up in the enum class when the serialized value is not in the lookup table."""
+        if self._members_folded is not None and isinstance(value, str):
             try:
-                value = self.enum_type[value]
+                return self._members_folded[value.lower()]
             except KeyError:
-                raise ValueError(f"Unknown enum key: {value}")
+                pass
 
-        return super().deserialize(value, **kwargs)
+        if self.use_values:
+            return self.enum_type(value)
+        try:
+            return self.enum_type[value]
+        except KeyError:
+            raise ValueError(f"Unknown enum key: {value}")
+
+
+_VALIDATE_DESERIALIZED = frozenset((Type, ISODateTime, ISOUTCDateTime, String, Int, Boolean, Amount, Enum))
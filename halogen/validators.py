@@ -1,11 +1,27 @@
 """Halogen basic type validators."""
 
+import sys
 from abc import abstractmethod
 from typing import Iterable, Any
 
 from halogen import exceptions
 
 
+def _enumerate(values, invalid):
+    """Enumerate the values to validate.
+
+    NumPy arrays are narrowed down to the values that the array operation finds invalid. NumPy is not imported for
+    it, if it is not imported the values can't be an array.
+
+    :param values: Values to validate.
+    :param invalid: Function that returns the boolean mask of the invalid values of an array.
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return ((int(index), values[index]) for index in numpy.flatnonzero(invalid(values)))
+    return enumerate(values)
+
+
 class Validator(object):
     """Base validator."""
 
@@ -18,6 +34,23 @@ class Validator(object):
         :raises: :class:`halogen.exception.ValidationError` exception when value is invalid.
         """
 
+    def validate_many(self, values, **kwargs) -> list:
+        """Validate every value of a list.
+
+        :param values: Values to validate.
+
+        :return: List of :class:`halogen.exception.ValidationError` exceptions of the invalid values, the index of
+            the value is set to the `index` of the exception.
+        """
+        errors = []
+        for index, value in enumerate(values):
+            try:
+                self.validate(value, **kwargs)
+            except exceptions.ValidationError as e:
+                e.index = index
+                errors.append(e)
+        return errors
+
 
 class LessThanEqual(Validator):
     """Less than or equal."""
@@ -39,6 +72,14 @@ class LessThanEqual(Validator):
         if value > compare_value:
             raise exceptions.ValidationError(self.value_err.format(value, compare_value))
 
+    def validate_many(self, values, **kwargs) -> list:
+        compare_value = self.value() if callable(self.value) else self.value
+        return [
+            exceptions.ValidationError(self.value_err.format(value, compare_value), index=index)
+            for index, value in _enumerate(values, lambda array: array > compare_value)
+            if value > compare_value
+        ]
+
 
 class GreatThanEqual(Validator):
     """Greater than or equal."""
@@ -60,6 +101,14 @@ class GreatThanEqual(Validator):
         if value < compare_value:
             raise exceptions.ValidationError(self.value_err.format(value, compare_value))
 
+    def validate_many(self, values, **kwargs) -> list:
+        compare_value = self.value() if callable(self.value) else self.value
+        return [
+            exceptions.ValidationError(self.value_err.format(value, compare_value), index=index)
+            for index, value in _enumerate(values, lambda array: array < compare_value)
+            if value < compare_value
+        ]
+
 
 class Length(Validator):
     """Length validator that checks the length of a List-like type."""
@@ -107,8 +156,31 @@ class Length(Validator):
             if length > max_length:
                 raise exceptions.ValidationError(self.max_err.format(max_length))
 
+    def validate_many(self, values, **kwargs) -> list:
+        """Validate the length of every list of a list.
 
-class Range(object):
+        :param values: Lists of values.
+
+        :return: List of :class:`halogen.exception.ValidationError` exceptions of the lists that have the length less
+            than minimum or greater than maximum, the index of the list is set to the `index` of the exception.
+        """
+        min_length = self.min_length() if callable(self.min_length) else self.min_length
+        max_length = self.max_length() if callable(self.max_length) else self.max_length
+        errors = []
+        for index, value in enumerate(values):
+            try:
+                length = len(value)
+            except TypeError:
+                length = 0
+
+            if min_length is not None and length < min_length:
+                errors.append(exceptions.ValidationError(self.min_err.format(min_length), index=index))
+            elif max_length is not None and length > max_length:
+                errors.append(exceptions.ValidationError(self.max_err.format(max_length), index=index))
+        return errors
+
+
+class Range(Validator):
     """Range validator.
 
     Validator which succeeds if the value it is passed is greater or equal to ``min`` and less than or equal to
@@ -152,6 +224,34 @@ class Range(object):
             if value > max_value:
                 raise exceptions.ValidationError(self.max_err.format(val=value, max=max_value))
 
+    def validate_many(self, values, **kwargs) -> list:
+        """Validate every value of a list.
+
+        :param values: Values which should be validated.
+
+        :return: List of :class:`halogen.exception.ValidationError` exceptions of the values that are less than min
+            or greater than max, the index of the value is set to the `index` of the exception.
+        """
+        min_value = self.min() if callable(self.min) else self.min
+        max_value = self.max() if callable(self.max) else self.max
+        if min_value is None and max_value is None:
+            return []
+
+        def invalid(array):
+            if min_value is None:
+                return array > max_value
+            if max_value is None:
+                return array < min_value
+            return (array < min_value) | (array > max_value)
+
+        errors = []
+        for index, value in _enumerate(values, invalid):
+            if min_value is not None and value < min_value:
+                errors.append(exceptions.ValidationError(self.min_err.format(val=value, min=min_value), index=index))
+            elif max_value is not None and value > max_value:
+                errors.append(exceptions.ValidationError(self.max_err.format(val=value, max=max_value), index=index))
+        return errors
+
 
 class OneOf(Validator):
     """Check that the value (or values) is among the list of available values"""
@@ -162,3 +262,11 @@ class OneOf(Validator):
     def validate(self, value) -> None:
         if value not in self.choices:
             raise exceptions.ValidationError(f'"{value}" is not a valid choice')
+
+    def validate_many(self, values, **kwargs) -> list:
+        choices = self.choices
+        return [
+            exceptions.ValidationError(f'"{value}" is not a valid choice', index=index)
+            for index, value in enumerate(values)
+            if value not in choices
+        ]
@@ -24,30 +24,13 @@ class Error(Exception):
     @classmethod
     def from_validation_exception(cls, exception, **kwargs):
         """Create an error from validation exception."""
-        errors = []
-
-        def flatten(error, path=""):
-            if isinstance(error, halogen.exceptions.ValidationError):
-                if not path.endswith("/"):
-                    path += "/"
-                if error.attr is not None:
-                    path += error.attr
-                elif error.index is not None:
-                    path += str(error.index)
-
-                for e in error.errors:
-                    flatten(e, path)
-            else:
-                if isinstance(error, Exception):
-                    message = str(error)
-                else:
-                    message = error
-                # TODO: i18n
-                errors.append(Error(message=message, path=path))
-
-        flatten(exception)
+        # TODO: i18n
+        errors = sorted(
+            (Error(message=message, path=path) for path, message in exception.iter_errors()),
+            key=lambda error: error.path or "",
+        )
         message = kwargs.pop("message", "Validation error.")
-        return cls(message=message, errors=sorted(errors, key=lambda error: error.path or ""), **kwargs)
+        return cls(message=message, errors=errors, **kwargs)
 
 
 class VNDError(halogen.Schema):
@@ -42,7 +42,7 @@ setup(
         "Programming Language :: Python :: 3.12",
     ],
     packages=["halogen", "halogen.vnd"],
-    install_requires=["cached-property", "isodate", "python-dateutil", "pytz"],
+    install_requires=["cached-property", "isodate", "python-dateutil"],
     tests_require=["tox"],
     python_requires=">=3.6",
 )
@@ -0,0 +1,68 @@
+"""Tests for the compiled deserialization of Halogen schemas."""
+
+import pytest
+
+import halogen
+
+
+def test_compiled_deserializer():
+    """Test that links are left out and the output is updated with the setters."""
+
+    class Schema(halogen.Schema):
+        self = halogen.Link(attr="uid")
+        name = halogen.Attr(halogen.types.String(), attr="person.name")
+        age = halogen.Attr(halogen.types.Int(), required=False)
+
+    assert Schema.deserialize({"person": {"name": "John"}}) == {"name": "John"}
+
+    output = {}
+    assert Schema.deserialize({"person": {"name": "John"}, "age": "42"}, output=output) is None
+    assert output == {"person": {"name": "John"}, "age": 42}
+
+
+def test_custom_attr_deserialize():
+    """Test that attributes overriding deserialize are deserialized with their own method."""
+
+    class UpperAttr(halogen.Attr):
+        def deserialize(self, value, **kwargs):
+            return super().deserialize(value, **kwargs).upper()
+
+    class Schema(halogen.Schema):
+        name = UpperAttr()
+
+    assert Schema.deserialize({"name": "foo"}) == {"name": "FOO"}
+
+
+def test_custom_accessor_get():
+    """Test that accessors overriding get are called when deserializing."""
+
+    class UpperAccessor(halogen.schema.Accessor):
+        def get(self, obj, **kwargs):
+            return super().get(obj).upper()
+
+    class Schema(halogen.Schema):
+        name = halogen.Attr(attr=UpperAccessor(getter="name", setter="name"))
+
+    assert Schema.deserialize({"name": "foo"}) == {"name": "FOO"}
+
+
+def test_nested_errors():
+    """Test that errors of nested schemas are collected under the attribute."""
+
+    class Nested(halogen.Schema):
+        count = halogen.Attr(halogen.types.Int())
+
+    class Schema(halogen.Schema):
+        nested = halogen.Attr(Nested)
+
+    with pytest.raises(halogen.exceptions.ValidationError) as err:
+        Schema.deserialize({"nested": {"count": "many"}})
+    assert err.value.to_dict() == {
+        "attr": "<root>",
+        "errors": [
+            {
+                "attr": "nested",
+                "errors": [{"attr": "count", "errors": [{"type": "ValueError", "error": "'many' is not an integer"}]}],
+            }
+        ],
+    }
@@ -0,0 +1,103 @@
+"""Test deserialization that stops at a number of errors."""
+
+import pytest
+
+import halogen
+from halogen import exceptions, validators
+
+
+def count_errors(error):
+    """Count the errors of the validation error tree that are not validation errors collecting other errors."""
+    if not isinstance(error, exceptions.ValidationError):
+        return 1
+    return sum(count_errors(e) for e in error.errors)
+
+
+class ItemSchema(halogen.Schema):
+    name = halogen.Attr(halogen.types.String(validators=[validators.Length(min_length=2)]))
+    amount = halogen.Attr(halogen.types.Int(validators=[validators.Range(min=0)]))
+
+
+class OrderSchema(halogen.Schema):
+    reference = halogen.Attr(halogen.types.Int())
+    items = halogen.Attr(halogen.types.List(ItemSchema))
+    quantities = halogen.Attr(halogen.types.List(halogen.types.Int(validators=[validators.Range(min=1)])))
+
+
+@pytest.fixture
+def invalid_order():
+    """Order with an invalid reference, and invalid items and quantities."""
+    return {
+        "reference": "not-int",
+        "items": [{"name": "x", "amount": -1}] * 100,
+        "quantities": [0] * 100,
+    }
+
+
+def test_all_errors(invalid_order):
+    """Test that all errors are collected by default."""
+    with pytest.raises(exceptions.ValidationError) as err:
+        OrderSchema.deserialize(invalid_order)
+    assert count_errors(err.value) == 301
+
+
+def test_fail_fast(invalid_order):
+    """Test that the deserialization stops at the first error."""
+    with pytest.raises(exceptions.ValidationError) as err:
+        OrderSchema.deserialize(invalid_order, fail_fast=True)
+    assert err.value.to_dict() == {
+        "errors": [{"errors": [{"type": "ValueError", "error": "'not-int' is not an integer"}], "attr": "reference"}],
+        "attr": "<root>",
+    }
+
+
+@pytest.mark.parametrize("max_errors", [2, 5, 150, 300])
+def test_max_errors(invalid_order, max_errors):
+    """Test that nested schemas and lists share the number of errors."""
+    with pytest.raises(exceptions.ValidationError) as err:
+        OrderSchema.deserialize(invalid_order, max_errors=max_errors)
+    assert count_errors(err.value) == max_errors
+
+
+def test_max_errors_invalid():
+    """Test that the number of errors must be positive."""
+    with pytest.raises(ValueError):
+        OrderSchema.deserialize({}, max_errors=0)
+
+
+def test_list_fail_fast():
+    """Test that the list stops at the first invalid item."""
+    type_ = halogen.types.List(ItemSchema)
+    with pytest.raises(exceptions.ValidationError) as err:
+        type_.deserialize([{"name": "ok", "amount": 1}, {"name": "x", "amount": 1}, {"amount": 1}], fail_fast=True)
+    assert [(error.index, count_errors(error)) for error in err.value.errors] == [(1, 1)]
+
+
+def test_type_fail_fast():
+    """Test that the type stops at the first failing validator."""
+    type_ = halogen.types.Int(validators=[validators.Range(min=10), validators.OneOf([20])])
+    with pytest.raises(exceptions.ValidationError) as err:
+        type_.deserialize(1, fail_fast=True)
+    assert count_errors(err.value) == 1
+
+    with pytest.raises(exceptions.ValidationError) as err:
+        type_.deserialize(1)
+    assert count_errors(err.value) == 2
+
+
+def test_not_in_context():
+    """Test that the error limit is not passed to the getters and validators."""
+    contexts = []
+
+    class Validator(validators.Validator):
+        def validate(self, value, **kwargs):
+            contexts.append(kwargs)
+
+    class Schema(halogen.Schema):
+        @halogen.attr(halogen.types.Type(validators=[Validator()]))
+        def value(obj, **kwargs):
+            contexts.append(kwargs)
+            return obj["value"]
+
+    assert Schema.deserialize({"value": 1}, fail_fast=True, language="en") == {"value": 1}
+    assert contexts == [{"language": "en"}, {"language": "en"}]
@@ -1,5 +1,8 @@
 """Test deserialization with defaults."""
 
+import copy
+
+import mock
 import pytest
 
 import halogen
@@ -117,3 +120,130 @@ def test_one_of():
     assert '\\"4\\" is not a valid choice' in str(err.value)
 
     Schema.deserialize({"attr": 3})
+
+
+@pytest.mark.parametrize(
+    ["validator", "values", "expected"],
+    [
+        (
+            halogen.validators.LessThanEqual(lambda: 1),
+            [0, 2, 1, 3],
+            [(1, "2 is bigger than 1"), (3, "3 is bigger than 1")],
+        ),
+        (halogen.validators.GreatThanEqual(lambda: 1), [0, 2, 1], [(0, "0 is smaller than 1")]),
+        (
+            halogen.validators.Range(lambda: 1, lambda: 2),
+            [0, 1, 2, 3],
+            [(0, "0 is less than minimum value 1"), (3, "3 is greater than maximum value 2")],
+        ),
+        (halogen.validators.Range(max=2), [0, 3], [(1, "3 is greater than maximum value 2")]),
+        (halogen.validators.Range(), [0, 3], []),
+        (
+            halogen.validators.Length(lambda: 1, lambda: 2),
+            [[], [1], 1, [1, 2, 3]],
+            [(0, "Length is less than 1"), (2, "Length is less than 1"), (3, "Length is greater than 2")],
+        ),
+        (halogen.validators.OneOf([1, 2]), [1, 3, 2], [(1, '"3" is not a valid choice')]),
+    ],
+)
+def test_validate_many(validator, values, expected):
+    """Test validation of the values of a list at once."""
+    errors = validator.validate_many(values)
+    assert [(error.index, error.errors[0]) for error in errors] == expected
+    for index, value in enumerate(values):
+        try:
+            validator.validate(value)
+        except halogen.exceptions.ValidationError as e:
+            assert (index, e.errors[0]) in expected
+
+
+def test_validate_many_bounds_once():
+    """Test that the callable bounds are evaluated once for the values of a list."""
+    bound = mock.Mock(return_value=10)
+    assert halogen.validators.Range(bound, bound).validate_many([10] * 5) == []
+    assert bound.call_count == 2
+
+
+def test_validate_many_numpy():
+    """Test validation of the values of a NumPy array."""
+    numpy = pytest.importorskip("numpy")
+    errors = halogen.validators.Range(1, 2).validate_many(numpy.array([0, 1, 2, 3]))
+    assert [(error.index, error.errors[0]) for error in errors] == [
+        (0, "0 is less than minimum value 1"),
+        (3, "3 is greater than maximum value 2"),
+    ]
+
+
+def test_list_validate_many():
+    """Test that the errors of the items of a list validated at once are reported per item."""
+
+    class Schema(halogen.Schema):
+        attr = halogen.Attr(
+            halogen.types.List(
+                halogen.types.Int(validators=[halogen.validators.Range(1, 2), halogen.validators.OneOf([2])])
+            )
+        )
+
+    with pytest.raises(halogen.exceptions.ValidationError) as err:
+        Schema.deserialize({"attr": ["2", 0, 2, 3]})
+    assert err.value.to_dict() == {
+        "errors": [
+            {
+                "errors": [
+                    {
+                        "errors": [
+                            {"errors": [{"error": "0 is less than minimum value 1", "type": "str"}], "attr": "<root>"},
+                            {"errors": [{"error": '"0" is not a valid choice', "type": "str"}], "attr": "<root>"},
+                        ],
+                        "index": 1,
+                    },
+                    {
+                        "errors": [
+                            {
+                                "errors": [{"error": "3 is greater than maximum value 2", "type": "str"}],
+                                "attr": "<root>",
+                            },
+                            {"errors": [{"error": '"3" is not a valid choice', "type": "str"}], "attr": "<root>"},
+                        ],
+                        "index": 3,
+                    },
+                ],
+                "attr": "attr",
+            }
+        ],
+        "attr": "<root>",
+    }
+    assert Schema.deserialize({"attr": ["2", 2]}) == {"attr": [2, 2]}
+
+
+def test_list_validate_overridden():
+    """Test that a validator that overrides validate but not validate_many validates the items one by one."""
+
+    class Even(halogen.validators.Range):
+        def validate(self, value):
+            super().validate(value)
+            if value % 2:
+                raise halogen.exceptions.ValidationError("{0} is odd".format(value))
+
+    type_ = halogen.types.Int(validators=[Even(min=0)])
+    with pytest.raises(halogen.exceptions.ValidationError):
+        type_.deserialize(1)
+    with pytest.raises(halogen.exceptions.ValidationError) as err:
+        halogen.types.List(type_).deserialize([1, 2, 3])
+    assert [error.index for error in err.value.errors] == [0, 2]
+
+
+def test_list_validate_many_split_once():
+    """Test that the validators are split off the item type once, and again when they change."""
+    item_type = halogen.types.Int(validators=[halogen.validators.Range(1, 2)])
+    type_ = halogen.types.List(item_type)
+    with mock.patch("copy.copy", wraps=copy.copy) as copy_type:
+        assert type_.deserialize([1, 2]) == [1, 2]
+        assert type_.deserialize([2, 1]) == [2, 1]
+    assert copy_type.call_count == 1
+
+    item_type.validators = [halogen.validators.Range(1, 3)]
+    assert type_.deserialize([3]) == [3]
+    type_.item_type = halogen.types.Int(validators=[halogen.validators.Range(5, 6)])
+    with pytest.raises(halogen.exceptions.ValidationError):
+        type_.deserialize([3])
@@ -51,4 +51,4 @@ def test_schema_override_attr_class():
 
         key = attr
 
-    assert T.__attrs__ == halogen.schema.OrderedDict(**{attr.name: attr})
+    assert T.__attrs__ == {attr.name: attr}
@@ -0,0 +1,115 @@
+"""Tests for the compiled serialization of Halogen schemas."""
+
+import json
+from collections import OrderedDict
+
+import halogen
+
+
+def test_compiled_serializer():
+    """Test that every schema class gets a compiled serializer."""
+
+    class Schema(halogen.Schema):
+        self = halogen.Link(attr="uid")
+        name = halogen.Attr()
+
+    assert Schema.serialize({"uid": "/test/1", "name": "foo"}) == Schema.__serializer__(
+        {"uid": "/test/1", "name": "foo"}, {}
+    )
+    assert halogen.Schema(name=halogen.Attr()).serialize({"name": "foo"}) == {"name": "foo"}
+
+
+def test_compartment_position():
+    """Test that a compartment is placed at the position of its first serialized attribute."""
+
+    class Schema(halogen.Schema):
+        first = halogen.Link(attr="first", required=False)
+        name = halogen.Attr()
+        second = halogen.Link(attr="second")
+
+    serialized = Schema.serialize({"name": "foo", "second": "/test/2"})
+    assert list(serialized.items()) == [("name", "foo"), ("_links", {"second": {"href": "/test/2"}})]
+
+
+def test_custom_attr_serialize():
+    """Test that attributes overriding serialize are serialized with their own method."""
+
+    class UpperAttr(halogen.Attr):
+        def serialize(self, value, **kwargs):
+            return super().serialize(value, **kwargs).upper()
+
+    class Schema(halogen.Schema):
+        name = UpperAttr()
+
+    assert Schema.serialize({"name": "foo"}) == {"name": "FOO"}
+
+
+def test_custom_accessor_get():
+    """Test that accessors overriding get are called with the context."""
+
+    class UpperAccessor(halogen.schema.Accessor):
+        def get(self, obj, **kwargs):
+            return super().get(obj).upper() + kwargs.get("suffix", "")
+
+    class Schema(halogen.Schema):
+        name = halogen.Attr(attr=UpperAccessor(getter="name"))
+
+    assert Schema.serialize({"name": "foo"}) == {"name": "FOO"}
+    assert Schema.serialize({"name": "foo"}, suffix="!") == {"name": "FOO!"}
+    assert Schema.dumps({"name": "foo"}) == '{"name": "FOO"}'
+
+
+def test_reassigned_getter():
+    """Test that a getter reassigned after the schema is compiled is used."""
+
+    class Schema(halogen.Schema):
+        self = halogen.Link("/child")
+        name = halogen.Attr()
+
+    class Parent(halogen.Schema):
+        self = halogen.Link("/parent")
+        child = halogen.Embedded(Schema, attr=lambda value: value)
+
+    Schema.__attrs__["name"].accessor.getter = "other"
+    assert Schema.serialize({"other": "bar"})["name"] == "bar"
+    assert Parent.serialize({"other": "bar"})["_embedded"]["child"]["name"] == "bar"
+
+    Schema.__attrs__["name"].accessor.getter = lambda value: value["other"].upper()
+    assert json.loads(Schema.dumps({"other": "bar"}))["name"] == "BAR"
+
+
+def test_dict_class():
+    """Test that the serialized values are plain dicts, unless the schema asks for another mapping type."""
+
+    class Person(halogen.Schema):
+        self = halogen.Link(attr=lambda person: "/people/1")
+        name = halogen.Attr()
+
+    class OrderedPerson(Person):
+        dict_class = OrderedDict
+
+    person = {"name": "John"}
+    assert type(Person.serialize(person)) is dict
+    assert type(Person.serialize(person)["_links"]) is dict
+
+    serialized = OrderedPerson.serialize(person)
+    assert serialized == OrderedDict([("_links", OrderedDict([("self", {"href": "/people/1"})])), ("name", "John")])
+    assert type(serialized["_links"]) is OrderedDict
+    assert type(serialized["_links"]["self"]) is OrderedDict
+    assert type(Person.serialize(person)["_links"]["self"]) is dict
+
+
+def test_dict_class_curies():
+    """Test that the links of the curies follow the mapping type of the schema."""
+    curie = halogen.Curie(name="doc", href="/docs/{rel}", templated=True)
+
+    class Person(halogen.Schema):
+        dict_class = OrderedDict
+
+        self = halogen.Link(attr=lambda person: "/people/1")
+        friends = halogen.schema.LinkList(attr=lambda person: ["/people/2"], curie=curie)
+
+    links = Person.serialize({})["_links"]
+    assert links["curies"] == [{"href": "/docs/{rel}", "name": "doc", "templated": True}]
+    assert type(links["curies"][0]) is OrderedDict
+    assert type(links["doc:friends"][0]) is OrderedDict
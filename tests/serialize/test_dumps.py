@@ -0,0 +1,148 @@
+"""Tests for the serialization of Halogen schemas into JSON text."""
+
+import datetime
+import decimal
+import enum
+import io
+import json
+
+import pytest
+
+import halogen
+from halogen.vnd.error import Error, VNDError
+
+
+class Amount(object):
+    """A combination of currency and amount."""
+
+    def __init__(self, currency, amount):
+        self.currency = currency
+        self.amount = amount
+
+    def as_quantized(self, digits):
+        return Amount(self.currency, self.amount.quantize(decimal.Decimal(10) ** -digits))
+
+    def as_tuple(self):
+        return self.currency, self.amount
+
+
+class Status(enum.Enum):
+    OPEN = "open"
+    CLOSED = "closed"
+
+
+class UpperString(halogen.types.String):
+    """A string type that overrides serialize, but not dumps."""
+
+    def serialize(self, value, **kwargs):
+        return super().serialize(value, **kwargs).upper()
+
+
+ACME = halogen.Curie(name="acme", href="/docs/{rel}", templated=True)
+
+
+class ItemSchema(halogen.Schema):
+    self = halogen.Link(attr=lambda item: "/items/{0}".format(item["id"]))
+    name = halogen.Attr(halogen.types.String())
+    code = halogen.Attr(UpperString(), attr="name")
+
+
+class OrderSchema(halogen.Schema):
+    self = halogen.Link(attr=lambda order: "/orders/{0}".format(order["id"]), curie=ACME)
+    id = halogen.Attr(halogen.types.Int())
+    paid = halogen.Attr(halogen.types.Boolean())
+    note = halogen.Attr(halogen.types.Nullable(halogen.types.String()))
+    status = halogen.Attr(halogen.types.Enum(Status, use_values=True))
+    created = halogen.Attr(halogen.types.ISOUTCDateTime())
+    total = halogen.Attr(halogen.types.Amount(currencies=["EUR"], amount_class=Amount))
+    tags = halogen.Attr(halogen.types.List(halogen.types.String()), default=[])
+    discount = halogen.Attr(required=False, exclude=(None,))
+    version = halogen.Attr("1.0")
+    items = halogen.Embedded(halogen.types.List(ItemSchema))
+    customer = halogen.Link(attr="customer", required=False)
+
+    @halogen.attr()
+    def language(order, language):
+        return language
+
+
+@pytest.fixture
+def order():
+    return {
+        "id": "42",
+        "paid": 1,
+        "note": None,
+        "status": Status.OPEN,
+        "created": datetime.datetime(2030, 1, 1, 15, 30, 10, 123, tzinfo=datetime.timezone.utc),
+        "total": Amount("EUR", decimal.Decimal("10.5")),
+        "tags": ["new", "ünïcode"],
+        "discount": None,
+        "items": [{"id": 1, "name": 'ticket "vip"'}, {"id": 2, "name": "parking"}],
+    }
+
+
+def test_dumps(order):
+    """Test that the JSON text is the same as the encoded serialized value."""
+    assert OrderSchema.dumps(order, language="eng") == json.dumps(OrderSchema.serialize(order, language="eng"))
+
+
+def test_dumps_optional_compartment(order):
+    """Test that optional compartments are placed as in the serialized value."""
+    order["customer"] = "/customers/1"
+    del order["items"]
+
+    class Schema(OrderSchema):
+        items = halogen.Embedded(halogen.types.List(ItemSchema), required=False)
+
+    assert Schema.dumps(order, language="eng") == json.dumps(Schema.serialize(order, language="eng"))
+
+
+def test_dumps_recursive_schema():
+    """Test that schemas embedding themselves can be encoded."""
+    error = Error("Validation error.", errors=[Error("Missing attribute.", path="/name")])
+    assert VNDError.dumps(error) == json.dumps(VNDError.serialize(error))
+
+
+def test_dumps_overridden_serialize(order):
+    """Test that the schemas overriding serialize are encoded with their own method."""
+
+    class Schema(OrderSchema):
+        @classmethod
+        def serialize(cls, value, **kwargs):
+            result = super().serialize(value, **kwargs)
+            result["extra"] = True
+            return result
+
+    assert json.loads(Schema.dumps(order, language="eng"))["extra"] is True
+
+
+def test_dumps_required(order):
+    """Test that missing required attributes are raised."""
+    del order["id"]
+    with pytest.raises(KeyError):
+        OrderSchema.dumps(order, language="eng")
+
+
+def test_dump(order):
+    """Test that the JSON text is written into a file-like object."""
+    fp = io.StringIO()
+    OrderSchema.dump(order, fp, language="eng")
+    assert fp.getvalue() == OrderSchema.dumps(order, language="eng")
+
+
+@pytest.mark.parametrize(
+    ["type_", "value"],
+    [
+        (halogen.types.Type(), {"key": [1, 2.5, None]}),
+        (halogen.types.String(), 'quo"te ✓'),
+        (halogen.types.Int(), True),
+        (halogen.types.Boolean(), 0),
+        (halogen.types.ISOUTCDate(), datetime.date(2030, 1, 1)),
+        (halogen.types.Enum(Status), Status.CLOSED),
+        (halogen.types.Nullable(halogen.types.Int()), None),
+        (halogen.types.List(UpperString()), ["a", "b"]),
+    ],
+)
+def test_type_dumps(type_, value):
+    """Test that types emit the JSON text of the serialized value."""
+    assert type_.dumps(value) == json.dumps(type_.serialize(value))
@@ -0,0 +1,86 @@
+"""Tests for the serialization of the selected fields."""
+
+import pytest
+
+import halogen
+
+calls = []
+
+
+class AuthorSchema(halogen.Schema):
+    """Author schema."""
+
+    self = halogen.Link(attr=lambda author: "/authors/{0}".format(author["id"]))
+    name = halogen.Attr()
+
+    @halogen.attr()
+    def biography(author):
+        calls.append("biography")
+        return "Biography of {0}".format(author["name"])
+
+
+class BookSchema(halogen.Schema):
+    """Book schema."""
+
+    self = halogen.Link(attr=lambda book: "/books/{0}".format(book["id"]))
+    title = halogen.Attr()
+
+    @halogen.attr()
+    def pages(book):
+        calls.append("pages")
+        return sum(chapter["pages"] for chapter in book["chapters"])
+
+    authors = halogen.Embedded(halogen.types.List(AuthorSchema))
+    publisher = halogen.Embedded(AuthorSchema, memoize=True)
+
+
+BOOK = {
+    "id": 1,
+    "title": "Halogen",
+    "chapters": [{"pages": 10}, {"pages": 20}],
+    "authors": [{"id": 1, "name": "John"}, {"id": 2, "name": "Jane"}],
+    "publisher": {"id": 3, "name": "Paylogic"},
+}
+
+
+def test_fields():
+    """Test that only the selected fields are serialized and their getters called."""
+    del calls[:]
+    serialized = BookSchema.serialize(BOOK, fields=["title", "_links.self", "_embedded.authors.name"])
+    assert serialized == {
+        "_links": {"self": {"href": "/books/1"}},
+        "title": "Halogen",
+        "_embedded": {"authors": [{"name": "John"}, {"name": "Jane"}]},
+    }
+    assert calls == []
+
+
+def test_fields_compartment():
+    """Test that a compartment selects all its attributes and an embedded resource selects all its fields."""
+    full = BookSchema.serialize(BOOK)
+    assert BookSchema.serialize(BOOK, fields="_links,_embedded.publisher") == {
+        "_links": full["_links"],
+        "_embedded": {"publisher": full["_embedded"]["publisher"]},
+    }
+    assert BookSchema.serialize_many([BOOK], fields=["_embedded.publisher._links"]) == [
+        {"_embedded": {"publisher": {"_links": {"self": {"href": "/authors/3"}}}}}
+    ]
+    assert list(BookSchema.serialize_iter([BOOK], fields=["pages"])) == [{"pages": 30}]
+
+
+def test_fields_compiled_once():
+    """Test that the serialization of a projection is compiled once."""
+    serializer = halogen.schema._projection(BookSchema, ["title", "pages"])
+    assert halogen.schema._projection(BookSchema, "pages,title") is serializer
+    assert halogen.schema._projection(BookSchema, " pages, title,") is serializer
+    assert BookSchema.serialize(BOOK, fields="title, _links") == {
+        "_links": {"self": {"href": "/books/1"}},
+        "title": "Halogen",
+    }
+
+
+@pytest.mark.parametrize("fields", [["isbn"], ["_links.author"], ["title.length"], ["_embedded.authors.age"]])
+def test_fields_unknown(fields):
+    """Test that the unknown fields are rejected."""
+    with pytest.raises(ValueError):
+        BookSchema.serialize(BOOK, fields=fields)
@@ -0,0 +1,79 @@
+"""Tests for the serialization of many values at once."""
+
+import mock
+
+import halogen
+
+
+class BookSchema(halogen.Schema):
+    """A test schema."""
+
+    @halogen.Link()
+    def self(book):
+        return "/books/{0}".format(book["id"])
+
+    title = halogen.Attr()
+
+    @halogen.attr()
+    def language(book, language):
+        return language
+
+
+def books():
+    """Generate books, like a database cursor would."""
+    for index in range(3):
+        yield {"id": index, "title": "Book {0}".format(index)}
+
+
+def test_schema_serialize_many():
+    """Test that serialize_many serializes every item of an iterable with the same context."""
+    assert BookSchema.serialize_many(books(), language="eng") == [
+        BookSchema.serialize(book, language="eng") for book in books()
+    ]
+
+
+def test_list_serialize_many():
+    """Test that the list type serializes schema items with serialize_many."""
+    type_ = halogen.types.List(BookSchema)
+    with mock.patch.object(halogen.schema, "_make_context", wraps=halogen.schema._make_context) as make_context:
+        serialized = type_.serialize(list(books()), language="eng")
+    # The context is made once for all the items
+    assert make_context.call_count == 1
+    assert serialized == [BookSchema.serialize(book, language="eng") for book in books()]
+
+
+def test_type_serialize_many():
+    """Test that types serialize every value of an iterable."""
+    assert halogen.types.Int().serialize_many(iter(["1", 2])) == [1, 2]
+    assert halogen.types.List(halogen.types.List(halogen.types.Int())).serialize([["1"], [2, "3"]]) == [[1], [2, 3]]
+
+
+class ExtraBookSchema(BookSchema):
+    """A schema that overrides serialize."""
+
+    @classmethod
+    def serialize(cls, value, **kwargs):
+        result = super().serialize(value, **kwargs)
+        result["extra"] = 1
+        return result
+
+
+def test_overridden_serialize():
+    """Test that the serialization of many values calls the overridden serialize."""
+    expected = [ExtraBookSchema.serialize(book, language="eng") for book in books()]
+    assert expected[0]["extra"] == 1
+    assert ExtraBookSchema.serialize_many(books(), language="eng") == expected
+    assert list(ExtraBookSchema.serialize_iter(books(), language="eng")) == expected
+    assert halogen.types.List(ExtraBookSchema).serialize(list(books()), language="eng") == expected
+
+
+def test_overridden_serialize_embedded():
+    """Test that a list embedded in a schema calls the overridden serialize of its items."""
+
+    class ShelfSchema(halogen.Schema):
+        self = halogen.Link("/shelf")
+        books = halogen.Embedded(halogen.types.List(ExtraBookSchema))
+
+    serialized = ShelfSchema.serialize({"books": list(books())}, language="eng")
+    assert [book["extra"] for book in serialized["_embedded"]["books"]] == [1, 1, 1]
+    assert "extra" in "".join(ShelfSchema.iterencode({"books": list(books())}, language="eng"))
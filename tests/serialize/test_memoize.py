@@ -0,0 +1,86 @@
+"""Tests for the memoization of the embedded resources."""
+
+import json
+
+import halogen
+
+calls = []
+
+
+class CustomerSchema(halogen.Schema):
+    """Customer schema."""
+
+    self = halogen.Link(attr=lambda customer: "/customers/{0}".format(customer["id"]))
+
+    @halogen.attr()
+    def name(customer):
+        calls.append(customer["id"])
+        return customer["name"]
+
+
+class OrderSchema(halogen.Schema):
+    """Order schema that memoizes the customers by their identity."""
+
+    self = halogen.Link(attr=lambda order: "/orders/{0}".format(order["id"]))
+    customer = halogen.Embedded(CustomerSchema, memoize=True)
+
+
+class OrderByKeySchema(halogen.Schema):
+    """Order schema that memoizes the customers by their id."""
+
+    self = halogen.Link(attr=lambda order: "/orders/{0}".format(order["id"]))
+    customer = halogen.Embedded(CustomerSchema, memoize=lambda customer: customer["id"])
+
+
+class OrdersSchema(halogen.Schema):
+    """Order collection schema."""
+
+    self = halogen.Link(attr=lambda orders: "/orders")
+    orders = halogen.Embedded(halogen.types.List(OrderSchema))
+    customers = halogen.Embedded(halogen.types.List(CustomerSchema), memoize=True)
+
+
+CUSTOMERS = [{"id": 1, "name": "John"}, {"id": 2, "name": "Jane"}]
+ORDERS = [{"id": index, "customer": CUSTOMERS[index % 2]} for index in range(5)]
+
+
+def test_memoize_identity():
+    """Test that the same resource is serialized once per call."""
+    del calls[:]
+    serialized = OrdersSchema.serialize({"orders": ORDERS, "customers": CUSTOMERS})
+    assert calls == [1, 2]
+
+    orders = serialized["_embedded"]["orders"]
+    assert orders[0]["_embedded"]["customer"] == {"_links": {"self": {"href": "/customers/1"}}, "name": "John"}
+    assert orders[0]["_embedded"]["customer"] is orders[2]["_embedded"]["customer"]
+    assert serialized["_embedded"]["customers"][1] is orders[1]["_embedded"]["customer"]
+
+    del calls[:]
+    OrdersSchema.serialize({"orders": ORDERS, "customers": CUSTOMERS})
+    assert calls == [1, 2]
+
+
+def test_memoize_key():
+    """Test that the resources with the same key are serialized once per call."""
+    del calls[:]
+    serialized = OrderByKeySchema.serialize_many([{"id": 1, "customer": dict(CUSTOMERS[0])} for _ in range(3)])
+    assert calls == [1]
+    assert serialized == [OrderSchema.serialize({"id": 1, "customer": CUSTOMERS[0]})] * 3
+
+
+def test_memoize_dumps():
+    """Test that the resources are encoded once per call."""
+    value = {"orders": ORDERS, "customers": CUSTOMERS}
+    del calls[:]
+    text = OrdersSchema.dumps(value)
+    assert calls == [1, 2]
+    assert json.loads(text) == OrdersSchema.serialize(value)
+    assert json.loads("".join(OrdersSchema.iterencode(value))) == OrdersSchema.serialize(value)
+
+
+def test_memoize_iter():
+    """Test that the lazily serialized values memoize their resources one value at a time."""
+    del calls[:]
+    serialized = list(OrderSchema.serialize_iter(order for order in ORDERS[:3]))
+    assert calls == [1, 2, 1]
+    assert serialized == [OrderSchema.serialize(order) for order in ORDERS[:3]]
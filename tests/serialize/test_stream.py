@@ -0,0 +1,104 @@
+"""Tests for the streaming serialization of Halogen schemas."""
+
+import json
+
+import pytest
+
+import halogen
+from halogen.vnd.error import Error, VNDError
+
+
+class ItemSchema(halogen.Schema):
+    """A test schema."""
+
+    @halogen.Link()
+    def self(item):
+        return "/items/{0}".format(item["id"])
+
+    name = halogen.Attr()
+    tags = halogen.Attr(halogen.types.List(halogen.types.String()))
+
+
+class CollectionSchema(halogen.Schema):
+    """A test collection schema."""
+
+    self = halogen.Link("/items")
+    total = halogen.Attr()
+    items = halogen.Embedded(halogen.types.List(ItemSchema))
+
+
+def items(count, consumed):
+    """Generate items, like a database cursor would, recording how many were consumed."""
+    for index in range(count):
+        consumed.append(index)
+        yield {"id": index, "name": "Item {0}".format(index), "tags": ["a", "ü"]}
+
+
+def test_iterencode():
+    """Test that the encoded chunks are the same as the encoded serialized value."""
+    collection = {"total": 3, "items": list(items(3, []))}
+    expected = json.dumps(CollectionSchema.serialize(collection))
+    assert "".join(CollectionSchema.iterencode(collection)) == expected
+
+
+def test_iterencode_lazy():
+    """Test that the items are consumed while the chunks are consumed."""
+    consumed = []
+    chunks = CollectionSchema.iterencode({"total": 1000, "items": items(1000, consumed)})
+    next(chunks)
+    assert 0 < len(consumed) < 1000
+
+    rest = "".join(chunks)
+    assert len(consumed) == 1000
+    assert rest.endswith("]}}")
+
+
+def test_iterencode_recursive_schema():
+    """Test that schemas embedding themselves can be encoded."""
+    error = Error("Validation error.", errors=[Error("Missing attribute.", path="/name")])
+    assert "".join(VNDError.iterencode(error)) == json.dumps(VNDError.serialize(error))
+
+
+def test_iterencode_item_error():
+    """Test that errors of the items are raised while iterating."""
+    chunks = CollectionSchema.iterencode({"total": 1, "items": [{"id": 1}]})
+    with pytest.raises(KeyError):
+        "".join(chunks)
+
+
+def test_iterencode_optional_item_error():
+    """Test that an optional list with an error in its items is left out, the same as in serialize."""
+
+    class OptionalCollectionSchema(halogen.Schema):
+        self = halogen.Link("/items")
+        items = halogen.Embedded(halogen.types.List(ItemSchema), required=False)
+        outer = halogen.Embedded(CollectionSchema, required=False)
+
+    collection = {"items": [{"id": 1}], "outer": {"total": 1, "items": [{"id": 1}]}}
+    expected = json.dumps(OptionalCollectionSchema.serialize(collection))
+    assert expected == '{"_links": {"self": {"href": "/items"}}}'
+    assert "".join(OptionalCollectionSchema.iterencode(collection)) == expected
+
+
+def test_iterencode_overridden_serialize():
+    """Test that the schemas overriding serialize are encoded with their own method."""
+
+    class Schema(ItemSchema):
+        @classmethod
+        def serialize(cls, value, **kwargs):
+            result = super().serialize(value, **kwargs)
+            result["extra"] = True
+            return result
+
+    item = {"id": 1, "name": "Item 1", "tags": []}
+    assert json.loads("".join(Schema.iterencode(item)))["extra"] is True
+
+
+def test_serialize_iter():
+    """Test that the values are serialized lazily."""
+    consumed = []
+    serialized = ItemSchema.serialize_iter(items(3, consumed))
+    assert consumed == []
+    assert next(serialized) == ItemSchema.serialize({"id": 0, "name": "Item 0", "tags": ["a", "ü"]})
+    assert consumed == [0]
+    assert halogen.types.Int().serialize_iter(iter(["1", 2])).__next__() == 1
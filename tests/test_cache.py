@@ -0,0 +1,175 @@
+"""Test the caches of the serialized values."""
+
+import json
+import os
+import time
+
+import pytest
+
+import halogen
+from halogen.cache import FileCache, MemoryCache, invalidate
+
+calls = []
+
+
+def event_schema(backend):
+    """Create an event schema with the cache."""
+
+    class EventSchema(halogen.Schema):
+        """Event schema."""
+
+        cache = backend
+        cache_key = "id"
+        cache_version = lambda event: event["modified"]
+        cache_context = ("language",)
+
+        self = halogen.Link(attr=lambda event: "/events/{0}".format(event["id"]))
+
+        @halogen.attr()
+        def title(event, language="eng"):
+            calls.append(event["id"])
+            return "{0} ({1})".format(event["title"], language)
+
+    return EventSchema
+
+
+@pytest.fixture(params=["memory", "file"])
+def cache(request, tmp_path):
+    """Cache backend."""
+    return MemoryCache() if request.param == "memory" else FileCache(str(tmp_path / "cache"))
+
+
+def test_cache(cache):
+    """Test that the serialized values are cached per version and context."""
+    schema = event_schema(cache)
+    event = {"id": 1, "title": "Concert", "modified": 1}
+    del calls[:]
+
+    serialized = schema.serialize(event)
+    assert serialized == {"_links": {"self": {"href": "/events/1"}}, "title": "Concert (eng)"}
+    assert schema.serialize(event) == serialized
+    assert json.loads(schema.dumps(event)) == json.loads(schema.dumps(event)) == serialized
+    assert calls == [1, 1]
+
+    assert schema.serialize(event, language="nld")["title"] == "Concert (nld)"
+    assert schema.serialize(event, language="nld", other=1)["title"] == "Concert (nld)"
+    assert calls == [1, 1, 1]
+
+    event["modified"] = 2
+    event["title"] = "Opera"
+    assert schema.serialize(event)["title"] == "Opera (eng)"
+    assert halogen.types.List(schema).serialize([event])[0]["title"] == "Opera (eng)"
+    assert calls == [1, 1, 1, 1]
+
+
+def test_cache_invalidate(cache):
+    """Test that the cached values of an object are invalidated."""
+    schema = event_schema(cache)
+    first, second = {"id": 1, "title": "Concert", "modified": 1}, {"id": 2, "title": "Opera", "modified": 1}
+    schema.serialize_many([first, second])
+    del calls[:]
+
+    invalidate(schema, first)
+    invalidate(schema, key=2)
+    schema.serialize_many([first, second])
+    assert calls == [1, 2]
+
+    cache.clear()
+    schema.dumps(first)
+    assert calls == [1, 2, 1]
+
+
+def test_memory_cache_eviction():
+    """Test that the least recently used and the expired values are evicted."""
+    now = [0]
+    cache = MemoryCache(max_size=2, ttl=10, timer=lambda: now[0])
+    cache.set("a", 1, "a1")
+    cache.set("b", 1, "b1")
+    assert cache.get("a", 1) == "a1"
+    cache.set("c", 1, "c1")
+    assert len(cache) == 2
+    with pytest.raises(KeyError):
+        cache.get("b", 1)
+
+    now[0] = 10
+    with pytest.raises(KeyError):
+        cache.get("a", 1)
+    assert len(cache) == 1
+
+    with pytest.raises(ValueError):
+        MemoryCache(max_size=0)
+
+
+def test_file_cache_expired(tmp_path):
+    """Test that the expired values are not returned."""
+    cache = FileCache(str(tmp_path), ttl=0)
+    cache.set("a", 1, "a1")
+    with pytest.raises(KeyError):
+        cache.get("a", 1)
+
+
+def test_file_cache_eviction(tmp_path):
+    """Test that the older versions and the expired values of a group are removed."""
+    cache = FileCache(str(tmp_path), ttl=10)
+    for version in range(5):
+        cache.set("a", ("serialize", version, ()), version)
+    cache.set("a", ("dumps", 4, ()), "4")
+    cache.set("a", ("serialize", 4, ("nld",)), 4)
+    directory = cache._group_directory("a")
+    assert len(os.listdir(directory)) == 3
+    assert cache.get("a", ("serialize", 4, ())) == 4
+    with pytest.raises(KeyError):
+        cache.get("a", ("serialize", 3, ()))
+
+    expired = time.time() - 10
+    os.utime(os.path.join(directory, cache._file_name(("dumps", 4, ()))), (expired, expired))
+    cache.set("a", ("serialize", 5, ()), 5)
+    assert sorted(os.listdir(directory)) == sorted(
+        [cache._file_name(("serialize", 5, ())), cache._file_name(("serialize", 4, ("nld",)))]
+    )
+
+
+def test_cache_namespace(cache):
+    """Test that the schemas with the same dotted path don't share their cached values."""
+
+    def letter_schema(backend, letter):
+        class LetterSchema(halogen.Schema):
+            cache = backend
+            cache_key = "id"
+            cache_namespace = letter if isinstance(backend, FileCache) else None
+
+            value = halogen.Attr(letter)
+
+        return LetterSchema
+
+    first, second = letter_schema(cache, "A"), letter_schema(cache, "B")
+    assert first.serialize({"id": 1}) == {"value": "A"}
+    assert second.serialize({"id": 1}) == {"value": "B"}
+    invalidate(second, key=1)
+    assert first.serialize({"id": 1}) == {"value": "A"}
+
+
+def test_cache_requires_key():
+    """Test that a cached schema needs a cache key."""
+    with pytest.raises(halogen.exceptions.InvalidSchemaDefinition):
+
+        class EventSchema(halogen.Schema):
+            cache = MemoryCache()
+            self = halogen.Link(attr=lambda event: "/events/{0}".format(event["id"]))
+
+
+def test_memory_cache_copies():
+    """Test that the callers can modify the values of the cache, unless the cache shares them."""
+    schema = event_schema(MemoryCache())
+
+    class ProgramSchema(halogen.Schema):
+        self = halogen.Link("/program")
+        event = halogen.Embedded(schema)
+
+    event = {"id": 1, "title": "Concert", "modified": 1}
+    ProgramSchema.serialize({"event": event})["_embedded"]["event"]["title"] = "Changed"
+    schema.serialize(event)["_links"]["self"]["href"] = "Changed"
+    assert schema.serialize(event) == {"_links": {"self": {"href": "/events/1"}}, "title": "Concert (eng)"}
+
+    shared = event_schema(MemoryCache(copy_values=False))
+    assert shared.serialize(event) is shared.serialize(event)
@@ -0,0 +1,152 @@
+"""Test the profiling of the schemas."""
+
+import itertools
+import json
+
+import pytest
+
+import halogen
+from halogen.profile import Profiler, main
+
+
+class AuthorSchema(halogen.Schema):
+    """Author schema."""
+
+    self = halogen.Link(attr=lambda value: "/authors/{0}".format(value["id"]))
+    name = halogen.Attr()
+
+
+class BookSchema(halogen.Schema):
+    """Book schema."""
+
+    title = halogen.Attr()
+    year = halogen.Attr(halogen.types.Int(), required=False)
+    author = halogen.Embedded(AuthorSchema)
+
+
+BOOK = {"title": "Halogen", "author": {"id": 1, "name": "John"}}
+
+
+def book():
+    """Book fixture factory."""
+    return dict(BOOK)
+
+
+def test_profile_disabled():
+    """Test that the schemas are compiled without the profiling when the profiler is disabled."""
+    serializer = BookSchema.__serializer__
+    with Profiler() as profiler:
+        assert profiler.enabled
+        assert BookSchema.__serializer__ is not serializer
+        BookSchema.serialize(BOOK)
+    assert not profiler.enabled
+    assert BookSchema.__serializer__.__name__ == serializer.__name__ == "serialize"
+    assert BookSchema.__serializer__.__code__ is serializer.__code__
+
+    calls = profiler.to_dict()["serialize"]["tests.test_profile.BookSchema"]["calls"]
+    BookSchema.serialize(BOOK)
+    assert profiler.to_dict()["serialize"]["tests.test_profile.BookSchema"]["calls"] == calls == 1
+
+
+def test_profile_to_dict():
+    """Test the statistics of the schemas and their attributes."""
+    # Every call of the timer advances it by a second
+    with Profiler(timer=itertools.count().__next__) as profiler:
+        assert BookSchema.serialize(BOOK) == json.loads(BookSchema.dumps(BOOK))
+        with pytest.raises(halogen.exceptions.ValidationError):
+            BookSchema.deserialize({"title": "Halogen", "year": "unknown"})
+
+    result = profiler.to_dict()
+    book = result["serialize"]["tests.test_profile.BookSchema"]
+    assert book["calls"] == 1
+    assert set(book["attrs"]) == {"title", "year", "_embedded.author"}
+    assert book["attrs"]["year"] == {"calls": 1, "total_time": 1, "self_time": 1, "exceptions": 1}
+    author = book["attrs"]["_embedded.author"]
+    assert author["total_time"] > author["self_time"]
+    assert author["total_time"] - author["self_time"] == (
+        result["serialize"]["tests.test_profile.AuthorSchema"]["total_time"]
+    )
+    assert book["total_time"] - book["self_time"] == sum(attr["total_time"] for attr in book["attrs"].values())
+    assert "_links.self" in result["dumps"]["tests.test_profile.AuthorSchema"]["attrs"]
+
+    deserialize = result["deserialize"]["tests.test_profile.BookSchema"]
+    assert deserialize["calls"] == deserialize["exceptions"] == 1
+    assert deserialize["attrs"]["year"]["exceptions"] == 1
+    assert deserialize["attrs"]["_embedded.author"]["exceptions"] == 1
+
+
+def test_profile_report():
+    """Test that the report is sorted and limited."""
+    with Profiler() as profiler:
+        for _ in range(10):
+            BookSchema.serialize(BOOK)
+        AuthorSchema.serialize(BOOK["author"])
+
+    lines = profiler.report(sort="calls", limit=3).splitlines()
+    assert lines[0].split() == ["operation", "schema", "attribute", "calls", "total", "ms", "self", "ms", "exceptions"]
+    assert len(lines) == 4
+    assert [line.split()[3] for line in lines[1:]] == ["11", "11", "11"]
+
+    with pytest.raises(ValueError):
+        profiler.report(sort="name")
+
+    profiler.reset()
+    assert profiler.to_dict() == {}
+
+
+def test_profile_single():
+    """Test that only one profiler can be enabled at once."""
+    with Profiler():
+        with pytest.raises(RuntimeError):
+            Profiler().enable()
+
+
+def test_main_factory(capsys):
+    """Test the command line profiler with a fixture factory."""
+    assert main(["tests.test_profile.BookSchema", "tests.test_profile:book", "--runs", "5", "--top", "2"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "tests.test_profile.BookSchema serialize, 5 runs"
+    assert lines[1].startswith("throughput: ")
+    assert lines[2].startswith("latency ms: min ")
+    assert lines[3].startswith("allocations per run: ")
+    assert len(lines) == 9
+    assert all(line.split()[3] == "5" for line in lines[-2:])
+
+
+def test_main_json(capsys, tmp_path):
+    """Test the command line profiler with a JSON fixture."""
+    fixture = tmp_path / "book.json"
+    fixture.write_text(json.dumps({"title": "Halogen", "year": "unknown"}))
+    assert main(["tests.test_profile.BookSchema", str(fixture), "--mode", "deserialize", "-n", "3"]) == 0
+    output = capsys.readouterr().out
+    assert output.startswith("tests.test_profile.BookSchema deserialize, 3 runs, 3 validation errors\n")
+    assert "deserialize  tests.test_profile.BookSchema  year" in output
+
+
+def test_main_not_schema():
+    """Test that the command line profiler requires a schema."""
+    with pytest.raises(SystemExit):
+        main(["tests.test_profile.book", "tests.test_profile:book"])
+
+
+def test_profile_memoized_list():
+    """Test that the schemas of the memoized embedded lists are profiled, and not after the profiler is disabled."""
+
+    class VenueSchema(halogen.Schema):
+        self = halogen.Link(attr=lambda venue: "/venues/{0}".format(venue["id"]))
+
+    class EventSchema(halogen.Schema):
+        self = halogen.Link("/events/1")
+        venues = halogen.Embedded(halogen.types.List(VenueSchema), memoize=True)
+
+    event = {"venues": [{"id": 1}, {"id": 2}]}
+    with Profiler() as profiler:
+        EventSchema.serialize(event)
+    assert (
+        profiler.to_dict()["serialize"]["tests.test_profile.test_profile_memoized_list.<locals>.VenueSchema"]["calls"]
+        == 2
+    )
+
+    profiler.reset()
+    EventSchema.serialize(event)
+    assert profiler.to_dict() == {}
@@ -3,6 +3,8 @@
 import decimal
 import datetime
 import enum
+import subprocess
+import sys
 from typing import Union
 
 import pytz
@@ -101,6 +103,45 @@ def test_isoutcdatetime_bc():
     assert type_.deserialize("1800-01-01T00:00:00Z") == value.replace(microsecond=0)
 
 
+class DateTime(datetime.datetime):
+    """Datetime subclass."""
+
+
+@pytest.mark.parametrize(
+    ["value", "serialized"],
+    [
+        (datetime.datetime(2018, 5, 14, 16, 20, 15, 999999), "2018-05-14T16:20:15"),
+        (datetime.datetime(2018, 5, 14, 16, 20, 15, 999999, tzinfo=pytz.UTC), "2018-05-14T16:20:15Z"),
+        (timezone("Europe/Amsterdam").localize(datetime.datetime(2018, 1, 1, 0, 30)), "2017-12-31T23:30:00Z"),
+        (datetime.datetime(800, 1, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=-1))), "0800-01-01T01:00:00Z"),
+        (DateTime(2018, 5, 14, 16, 20, 15, 999999, tzinfo=pytz.UTC), "2018-05-14T16:20:15Z"),
+        (datetime.date(2018, 5, 14), "2018-05-14"),
+    ],
+)
+def test_isoutcdatetime_format(value, serialized):
+    """Test iso datetime formatting of naive, aware and UTC datetimes and dates."""
+    type_ = types.ISOUTCDateTime()
+    assert type_.serialize(value) == serialized
+    assert type_.serialize_many([value, value]) == [serialized, serialized]
+
+
+def test_isoutcdatetime_serialize_many_none():
+    """Test that None in a list of datetimes is not serialized."""
+    with pytest.raises(ValueError):
+        types.ISOUTCDateTime().serialize_many([datetime.datetime(2018, 5, 14), None])
+
+
+def test_isoutcdatetime_serialize_many_override():
+    """Test that serialize_many respects the overridden serialize."""
+
+    class Timestamp(types.ISOUTCDateTime):
+        def serialize(self, value, **kwargs):
+            return value.timestamp()
+
+    value = datetime.datetime(2018, 5, 14, tzinfo=pytz.UTC)
+    assert Timestamp().serialize_many([value]) == [value.timestamp()]
+
+
 @pytest.mark.parametrize("value", ["01.01.1981 11:11:11", "123x3"])
 def test_isoutcdatetime_wrong(value):
     """Test iso datetime when wrong value is passed."""
@@ -110,6 +151,41 @@ def test_isoutcdatetime_wrong(value):
     assert err.value.args[0] == "'{0}' is not a valid ISO-8601 datetime".format(value)
 
 
+@pytest.mark.parametrize(
+    ["value", "expected"],
+    [
+        ("2018-05-14T16:20:00", datetime.datetime(2018, 5, 14, 16, 20)),
+        ("2018-05-14T16:20:00Z", datetime.datetime(2018, 5, 14, 16, 20, tzinfo=pytz.UTC)),
+        (
+            "2018-05-14T16:20:00.25+02:00",
+            datetime.datetime(2018, 5, 14, 16, 20, 0, 250000, tzinfo=datetime.timezone(datetime.timedelta(hours=2))),
+        ),
+        (
+            "2018-05-14T16:20:00-05:30",
+            datetime.datetime(2018, 5, 14, 16, 20, tzinfo=datetime.timezone(-datetime.timedelta(hours=5, minutes=30))),
+        ),
+        ("20180514T162000Z", datetime.datetime(2018, 5, 14, 16, 20, tzinfo=pytz.UTC)),
+        ("2018-05-14T16:20:00.1234567Z", datetime.datetime(2018, 5, 14, 16, 20, 0, 123456, tzinfo=pytz.UTC)),
+    ],
+)
+def test_isodatetime_formats(value, expected):
+    """Test that both the common and the other ISO-8601 datetime formats are parsed."""
+    for type_ in (types.ISODateTime(), types.ISOUTCDateTime()):
+        deserialized = type_.deserialize(value)
+        assert deserialized == expected
+        assert deserialized.utcoffset() == expected.utcoffset()
+        assert deserialized.tzinfo is None or type(deserialized.tzinfo) is datetime.timezone
+
+
+@pytest.mark.parametrize("value", ["2018-02-30T16:20:00Z", "2018-05-14T25:20:00Z", "2018-13-14T16:20:00"])
+def test_isodatetime_out_of_range(value):
+    """Test that the datetime in the common format but out of range is reported as invalid."""
+    for type_ in (types.ISODateTime(), types.ISOUTCDateTime()):
+        with pytest.raises(ValueError) as err:
+            type_.deserialize(value)
+        assert err.value.args[0] == "'{0}' is not a valid ISO-8601 datetime".format(value)
+
+
 def test_isodate():
     """Test iso datetime."""
     type_ = types.ISOUTCDate()
@@ -119,6 +195,23 @@ def test_isodate():
     assert type_.deserialize(serialized) == value
 
 
+@pytest.mark.parametrize(
+    ["value", "expected"],
+    [("2018-05-14", datetime.date(2018, 5, 14)), ("20180514", datetime.date(2018, 5, 14))],
+)
+def test_isodate_formats(value, expected):
+    """Test that both the common and the other ISO-8601 date formats are parsed."""
+    assert types.ISOUTCDate().deserialize(value) == expected
+
+
+@pytest.mark.parametrize("value", ["2018-02-30", "2018-5-14", "14-05-2018"])
+def test_isodate_wrong(value):
+    """Test iso date when wrong value is passed."""
+    with pytest.raises(ValueError) as err:
+        types.ISOUTCDate().deserialize(value)
+    assert err.value.args[0] == "'{0}' is not a valid ISO-8601 date".format(value)
+
+
 def test_string():
     """Test string type."""
     type_ = types.String()
@@ -142,6 +235,39 @@ def test_int():
     assert err.value.args[0] == "'not-int' is not an integer"
 
 
+class Str(str):
+    """String subclass."""
+
+
+@pytest.mark.parametrize(
+    ["type_", "value", "expected"],
+    [
+        (types.String(), Str("value"), "value"),
+        (types.Int(), True, 1),
+        (types.Int(), 1.5, 1),
+        (types.Boolean(), 1, True),
+    ],
+)
+def test_exact_types(type_, value, expected):
+    """Test that the values of the other types, including the subclasses, are converted."""
+    for converted in (type_.serialize(value), type_.deserialize(value)):
+        assert converted == expected
+        assert type(converted) is type(expected)
+
+
+@pytest.mark.parametrize(
+    ["type_", "value"], [(types.String, "value"), (types.Int, 1), (types.Boolean, True)], ids=["str", "int", "bool"]
+)
+def test_exact_types_validators(type_, value):
+    """Test that the validators run for the values of the exact type."""
+    validator = mock.Mock()
+    validator.validate.side_effect = exceptions.ValidationError("Invalid.")
+    assert type_().deserialize(value) is value
+    with pytest.raises(exceptions.ValidationError):
+        type_(validators=[validator]).deserialize(value)
+    validator.validate.assert_called_once_with(value)
+
+
 @pytest.mark.parametrize(
     ["value", "clean_value", "expected"],
     [
@@ -213,6 +339,53 @@ def test_amount_invalid(value):
         type_.deserialize(value)
 
 
+def test_amount_currencies():
+    """Test that the currencies are frozen and that unhashable currencies are not valid."""
+    currencies = ["EUR"]
+    type_ = types.Amount(currencies=currencies, amount_class=dict)
+    currencies.append("USD")
+    assert type_.currencies == frozenset(["EUR"])
+
+    with pytest.raises(ValueError) as err:
+        type_.deserialize({"currency": ["EUR"], "amount": "1.00"})
+    assert err.value.args[0] == "'['EUR']' is not a valid currency."
+
+
+@pytest.mark.parametrize(
+    ["value", "expected"],
+    [
+        ("INV1", "'INV' is not a valid currency."),
+        ("EURnot-number", "'not-number' cannot be parsed to decimal."),
+        ("EUR 11.234", "'11.234' has more than 2 decimal places."),
+    ],
+)
+def test_amount_cache_invalid(value, expected):
+    """Test that the invalid amounts are not cached."""
+    type_ = types.Amount(currencies=["EUR"], amount_class=dict, cache_size=2)
+    for _ in range(2):
+        with pytest.raises(ValueError) as err:
+            type_.deserialize(value)
+        assert err.value.args[0] == expected
+
+
+def test_amount_cache():
+    """Test that the parsed amounts are cached, the validators run on every value."""
+    amount_class = mock.Mock()
+    validator = mock.Mock()
+    type_ = types.Amount(currencies=["EUR"], amount_class=amount_class, cache_size=2, validators=[validator])
+
+    first = type_.deserialize("EUR10.00")
+    assert type_.deserialize({"currency": "EUR", "amount": "10.00"}) is first
+    assert type_.deserialize("EUR10.00") is first
+    amount_class.assert_called_once_with(currency="EUR", amount=decimal.Decimal("10"))
+    assert validator.validate.call_count == 3
+
+    type_.deserialize("EUR11.00")
+    type_.deserialize("EUR12.00")
+    type_.deserialize("EUR10.00")
+    assert amount_class.call_count == 4
+
+
 def test_amount_serialize():
     """Test amount serialize."""
     type_ = types.Amount(currencies=["EUR"], amount_class=dict)
@@ -228,6 +401,61 @@ def test_amount_serialize():
         type_.serialize(None)
 
 
+class Amount(object):
+    """Amount."""
+
+    def __init__(self, currency, amount):
+        self.currency = currency
+        self.amount = amount
+
+    def as_quantized(self, digits=0):
+        return Amount(self.currency, self.amount.quantize(decimal.Decimal(10) ** -digits))
+
+    def as_tuple(self):
+        return self.currency, self.amount
+
+
+def test_amount_serialize_many():
+    """Test serialization of a list of amounts."""
+    type_ = types.Amount(currencies=["EUR"], amount_class=Amount)
+    values = [
+        Amount("EUR", decimal.Decimal("1.5")),
+        Amount("EUR", decimal.Decimal("1.50")),
+        {"currency": "EUR", "amount": "2.00"},
+        Amount("EUR", decimal.Decimal("sNaN")),
+        Amount("EUR", decimal.Decimal("1.5")),
+    ]
+    serialized = type_.serialize_many(values[:3] + values[4:])
+    assert serialized == [
+        {"amount": "1.50", "currency": "EUR"},
+        {"amount": "1.50", "currency": "EUR"},
+        {"amount": "2.00", "currency": "EUR"},
+        {"amount": "1.50", "currency": "EUR"},
+    ]
+    assert serialized[0] is not serialized[1]
+
+    with pytest.raises(decimal.InvalidOperation):
+        type_.serialize_many(values)
+
+    with pytest.raises(ValueError) as err:
+        type_.serialize_many([Amount("USD", decimal.Decimal("1.5"))])
+    assert err.value.args[0] == "'USD' is not a valid currency."
+
+    with pytest.raises(ValueError):
+        type_.serialize_many([None])
+
+
+def test_amount_serialize_many_override():
+    """Test that serialize_many respects the overridden conversion."""
+
+    class Cents(types.Amount):
+        def amount_object_to_dict(self, amount):
+            return {"cents": int(amount.amount * 100), "currency": amount.currency}
+
+    type_ = Cents(currencies=["EUR"], amount_class=Amount)
+    assert type_.serialize_many([Amount("EUR", decimal.Decimal("1.5"))]) == [{"cents": 150, "currency": "EUR"}]
+
+
 def test_nullable_type():
 
     nested_type = mock.MagicMock(
@@ -328,6 +556,106 @@ def test_invalid_enum(value: Union[int, str, float], use_values: bool, expected_
         type_.deserialize(value)
 
 
+class Status(enum.Enum):
+    """Status enum."""
+
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+    DISABLED = "inactive"
+    ARCHIVED = ["archived"]
+
+
+@pytest.mark.parametrize(
+    ["value", "use_values", "expected"],
+    [
+        ("ACTIVE", False, Status.ACTIVE),
+        ("DISABLED", False, Status.INACTIVE),
+        ("active", True, Status.ACTIVE),
+        (Status.ACTIVE, True, Status.ACTIVE),
+        (["archived"], True, Status.ARCHIVED),
+    ],
+)
+def test_enum_lookup(value, use_values, expected):
+    """Test that the enum members are deserialized from their names, values and enum aliases."""
+    type_ = types.Enum(Status, use_values=use_values)
+    assert type_.deserialize(value) is expected
+    if value is not expected:
+        assert type_.serialize(expected) == (expected.value if use_values else expected.name)
+
+
+@pytest.mark.parametrize(
+    ["value", "use_values", "expected"],
+    [
+        ("active", False, Status.ACTIVE),
+        ("Active", True, Status.ACTIVE),
+        ("enabled", False, Status.ACTIVE),
+        ("ENABLED", True, Status.ACTIVE),
+    ],
+)
+def test_enum_case_insensitive(value, use_values, expected):
+    """Test the case insensitive lookup of the names, values and aliases."""
+    type_ = types.Enum(Status, use_values=use_values, case_sensitive=False, aliases={"Enabled": Status.ACTIVE})
+    assert type_.deserialize(value) is expected
+
+
+@pytest.mark.parametrize(
+    ["value", "use_values", "expected_error"],
+    [("active", False, "Unknown enum key: active"), ("Active", True, "'Active' is not a valid Status")],
+)
+def test_enum_case_sensitive(value, use_values, expected_error):
+    """Test that the lookup is case sensitive by default."""
+    type_ = types.Enum(Status, use_values=use_values, aliases={"enabled": Status.ACTIVE})
+    with pytest.raises(ValueError, match=expected_error):
+        type_.deserialize(value)
+    with pytest.raises(ValueError):
+        type_.deserialize("Enabled")
+
+
+@pytest.mark.parametrize("use_values", [True, False])
+def test_enum_serialize_many(use_values):
+    """Test serialization of a list of enum members."""
+    type_ = types.Enum(Status, use_values=use_values)
+    values = [Status.ACTIVE, Status.DISABLED, Status.ARCHIVED]
+    assert type_.serialize_many(values) == [type_.serialize(value) for value in values]
+    with pytest.raises(ValueError):
+        type_.serialize_many([None])
+
+
+def test_enum_serialize_equal_values():
+    """Test that the values that only compare equal to the members are not serialized as the members."""
+
+    class Level(enum.IntEnum):
+        LOW = 1
+
+    type_ = types.Enum(Level)
+    assert type_.serialize(Level.LOW) == type_.serialize_many([Level.LOW])[0] == "LOW"
+    assert type_.dumps(Level.LOW) == '"LOW"'
+    with pytest.raises(AttributeError):
+        type_.serialize(1)
+    with pytest.raises(AttributeError):
+        type_.serialize_many([1])
+    with pytest.raises(AttributeError):
+        type_.dumps(1)
+
+
+def test_enum_serialize_flag_composite():
+    """Test that the composite values of a Flag are serialized."""
+
+    class Perm(enum.Flag):
+        R = 4
+        W = 2
+
+    type_ = types.Enum(Perm)
+    assert type_.serialize(Perm.R | Perm.W) == type_.serialize_many([Perm.R | Perm.W])[0] == "R|W"
+    assert type_.dumps(Perm.R | Perm.W) == '"R|W"'
+    assert types.Enum(Perm, use_values=True).serialize(Perm.R | Perm.W) == 6
+
+    class PermSchema(Schema):
+        perm = Attr(types.Enum(Perm), required=False)
+
+    assert PermSchema.serialize({"perm": Perm.R | Perm.W}) == {"perm": "R|W"}
+
+
 def test_nullable_enum():
     class TestEnum(enum.Enum):
         FOO = 1
@@ -344,3 +672,44 @@ def test_mutable_validators():
     type = types.Int(validators=validators)
     validators.append("b")
     assert len(type.validators) == 1
+
+
+def test_lazy_import():
+    """Test that the lenient datetime parsers are not imported with halogen."""
+    code = "import sys, halogen; print(sorted({'dateutil', 'isodate', 'pytz'} & set(sys.modules)))"
+    output = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, universal_newlines=True, check=True)
+    assert output.stdout.strip() == "[]"
+
+
+def test_reassign_validators():
+    """Test that reassigning the validators takes effect."""
+    validator = mock.Mock()
+    validator.validate.side_effect = exceptions.ValidationError("Invalid.")
+    type_ = types.Type()
+    assert type_.deserialize(1) == 1
+
+    type_.validators = [validator]
+    assert type_.validators == (validator,)
+    with pytest.raises(exceptions.ValidationError):
+        type_.deserialize(1)
+
+    type_.validators = []
+    assert type_.deserialize(1) == 1
+
+
+def test_list_validators_once():
+    """Test that the validators of the list run once, before the items are deserialized."""
+    validator = mock.Mock()
+    item_type = mock.Mock(wraps=types.Int())
+    type_ = types.List(item_type, validators=[validator])
+    assert type_.deserialize(["1", "2"]) == [1, 2]
+    validator.validate.assert_called_once_with(["1", "2"])
+
+    validator.validate.side_effect = exceptions.ValidationError("Too long.")
+    with pytest.raises(exceptions.ValidationError) as err:
+        type_.deserialize(["1", "not-int"])
+    assert err.value.to_dict() == {
+        "errors": [{"errors": [{"type": "str", "error": "Too long."}], "attr": "<root>"}],
+        "attr": "<root>",
+    }
+    assert item_type.deserialize.call_count == 2
@@ -7,3 +7,24 @@ def test_accessor_repr():
     """Test Accessor repr."""
     acc = Accessor(getter="some.value", setter="some.other.value")
     assert repr(acc) == "<Accessor getter='some.value', setter='some.other.value'>"
+
+
+def test_accessor_reassign_path():
+    """Test that reassigning the dotted paths of the Accessor takes effect."""
+    acc = Accessor(getter="some.value", setter="some.value")
+    acc.getter = "other.value"
+    acc.setter = "other.value"
+
+    obj = {}
+    acc.set(obj, 1)
+    assert obj == {"other": {"value": 1}}
+    assert acc.get(obj) == 1
+
+
+def test_accessor_reassign_callable():
+    """Test that reassigning a callable getter with a different signature takes effect."""
+    acc = Accessor(getter=lambda obj: obj["value"])
+    assert acc.get({"value": 1}, offset=1) == 1
+
+    acc.getter = lambda obj, offset: obj["value"] + offset
+    assert acc.get({"value": 1}, offset=1) == 2
@@ -0,0 +1,31 @@
+"""Test the context of the serialization calls."""
+
+import halogen
+from halogen.schema import _Context, _make_context
+
+
+def test_context_filter():
+    """Test that the filtered context is memoized per set of arguments."""
+    context = _Context(language="dut", currency="EUR")
+    args = frozenset(["obj", "language"])
+
+    assert context.filter(args) == {"language": "dut"}
+    assert context.filter(args) is context.filter(frozenset(["obj", "language"]))
+    assert context.filter(frozenset(["obj"])) == {}
+
+
+def test_empty_context():
+    """Test that calls without context share the same empty context."""
+    assert _make_context({}) is _make_context({})
+    assert _make_context({}).filter(frozenset(["language"])) == {}
+
+
+def test_context_not_shared_between_calls():
+    """Test that the memoized context of one call doesn't leak into the next one."""
+
+    class Schema(halogen.Schema):
+        message = halogen.Attr(attr=lambda error, language: error["message"][language])
+
+    error = {"message": {"dut": "Ongeldig e-mailadres", "eng": "Invalid email address"}}
+    assert Schema.serialize(error, language="dut") == {"message": "Ongeldig e-mailadres"}
+    assert Schema.serialize(error, language="eng") == {"message": "Invalid email address"}
@@ -0,0 +1,55 @@
+"""Test the ValidationError."""
+
+import json
+import pickle
+
+from halogen.exceptions import ValidationError
+
+
+def test_validation_error_cached():
+    """Test that the string of the error is cached until the error tree changes."""
+    child = ValidationError([ValueError("invalid")], attr="key")
+    error = ValidationError([child])
+    assert str(error) is str(error)
+
+    child.attr = "other"
+    assert json.loads(str(error))["errors"][0] == {
+        "attr": "other",
+        "errors": [{"type": "ValueError", "error": "invalid"}],
+    }
+    child.index = 1
+    assert json.loads(str(error))["errors"][0] == {"index": 1, "errors": [{"type": "ValueError", "error": "invalid"}]}
+    child.errors.append("message")
+    assert json.loads(str(error))["errors"][0]["errors"][1] == {"type": "str", "error": "message"}
+    error.errors = ["message"]
+    assert str(error) == '{"errors": [{"type": "str", "error": "message"}], "attr": "<root>"}'
+
+
+def test_validation_error_to_dict_copy():
+    """Test that the dictionary representation can be modified by the caller."""
+    error = ValidationError(["message"], attr="key")
+    error.to_dict()["code"] = 400
+    assert error.to_dict() == {"attr": "key", "errors": [{"type": "str", "error": "message"}]}
+    assert str(error) == '{"errors": [{"type": "str", "error": "message"}], "attr": "key"}'
+
+
+def test_validation_error_iter_errors():
+    """Test that the errors are flattened into paths and messages."""
+    error = ValidationError(
+        [
+            ValidationError(ValueError("invalid"), attr="key"),
+            ValidationError([ValidationError("message", attr="name")], attr="items", index=None),
+            ValidationError(ValidationError("message", attr="name"), index=0),
+        ]
+    )
+    assert list(error.iter_errors()) == [
+        ("/key", "invalid"),
+        ("/items/name", "message"),
+        ("/0/name", "message"),
+    ]
+
+
+def test_validation_error_pickle():
+    """Test that the error survives pickling."""
+    error = pickle.loads(pickle.dumps(ValidationError(["message"], attr="key", index=1)))
+    assert (error.errors, error.attr, error.index) == (["message"], "key", 1)